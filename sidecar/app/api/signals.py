@@ -1,6 +1,10 @@
 """Signals API endpoint - polled by MT5 EA"""
 
-from fastapi import APIRouter
+import asyncio
+import time
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
 from app.memory.short_term_memory import short_term_memory as episodic_memory
 from fastapi import HTTPException
 from pydantic import BaseModel, Field
@@ -36,10 +40,22 @@ class SignalsResponse(BaseModel):
     count: int = Field(default=0)
 
 
+def _rejected_by_ea(plan, min_confidence: float, excluded: set) -> bool:
+    """Whether a plan is below min_confidence or on a symbol the EA already holds"""
+    if plan.confidence < min_confidence:
+        return True
+    # The EA may report either name for a symbol, e.g. NAS100 or US100
+    return bool(excluded) and (
+        plan.symbol in excluded or symbol_mapper.map_symbol(plan.symbol) in excluded
+    )
+
+
 @router.get("", response_model=SignalsResponse)
 async def get_signals(
     equity: Optional[float] = 1000.0,
-    include_features: bool = False
+    include_features: bool = False,
+    min_confidence: float = 0.0,
+    exclude: str = ""
 ):
     """
     Get trading signals for MT5 EA
@@ -50,6 +66,8 @@ async def get_signals(
     Args:
         equity: Current account equity (for position sizing)
         include_features: Include full feature dict in response
+        min_confidence: Drop plans below this confidence before sizing them
+        exclude: Comma-separated symbols the EA already holds (generic or broker)
     
     Returns:
         SignalsResponse with list of trading signals
@@ -60,6 +78,7 @@ async def get_signals(
         from app.risk.position_sizing import position_sizer
         
         logger.debug(f"Signals requested by EA (equity: ${equity:.2f})")
+        excluded = {symbol.strip() for symbol in exclude.split(",") if symbol.strip()}
         
         # Get existing positions to check correlation
         existing_positions = []
@@ -91,6 +110,10 @@ async def get_signals(
         signals = []
         filtered_count = 0
         for plan in plans:
+            # Drop plans the EA would reject anyway before pricing and sizing them
+            if _rejected_by_ea(plan, min_confidence, excluded):
+                continue
+            
             try:
                 # Get current price and spread from MT5 or features
                 current_price = plan.features.get('close', 15000)  # Fallback
@@ -270,6 +293,46 @@ async def get_signals(
         raise HTTPException(status_code=500, detail=f"Error generating signals: {str(e)}")
 
 
+@router.get("/stream")
+async def stream_signals(
+    request: Request,
+    equity: Optional[float] = 1000.0,
+    min_confidence: float = 0.0,
+    exclude: str = "",
+    interval: float = 2.0,
+    max_seconds: float = 300.0
+):
+    """
+    Server-sent event stream of trading signals
+    
+    Runs the same pipeline as GET /signals every `interval` seconds and pushes
+    each non-empty result as a `data:` frame, so the EA reacts to a new signal
+    without polling. Empty scans send a keep-alive comment. The stream ends
+    after `max_seconds` so clients reconnect with fresh equity.
+    """
+    async def events():
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline and not await request.is_disconnected():
+            try:
+                response = await get_signals(
+                    equity=equity,
+                    include_features=False,
+                    min_confidence=min_confidence,
+                    exclude=exclude,
+                )
+            except HTTPException:
+                response = None  # already logged by get_signals
+            
+            if response is not None and response.count:
+                yield f"data: {response.model_dump_json()}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            
+            await asyncio.sleep(interval)
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 
 @router.get("/scanner/stats")
 async def get_scanner_stats():
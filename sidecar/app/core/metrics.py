@@ -7,7 +7,7 @@ including counters, gauges, and histograms for performance monitoring.
 
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional
 from collections import defaultdict, deque
 import asyncio
 import logging
@@ -25,6 +25,15 @@ class MetricsCollector:
     - Histograms: Distribution of values (e.g., latency percentiles)
     """
     
+    __slots__ = (
+        "window_size",
+        "counters",
+        "gauges",
+        "histograms",
+        "start_time",
+        "last_reset",
+    )
+    
     def __init__(self, window_size: int = 1000):
         """
         Initialize metrics collector
@@ -55,6 +64,17 @@ class MetricsCollector:
         """Increment a counter by value"""
         self.counters[name] += value
     
+    def bulk_increment(self, increments: Mapping[str, int]):
+        """
+        Increment several counters in one call
+        
+        Args:
+            increments: Mapping of counter name to increment value
+        """
+        counters = self.counters
+        for name, value in increments.items():
+            counters[name] += value
+    
     def get_counter(self, name: str) -> int:
         """Get current counter value"""
         return self.counters.get(name, 0)
@@ -79,6 +99,18 @@ class MetricsCollector:
         """Record a value in a histogram"""
         self.histograms[name].append(value)
     
+    def record_values(self, name: str, values: Iterable[float]):
+        """
+        Record a batch of values in a histogram
+        
+        Args:
+            name: Histogram name
+            values: Iterable of values (lists and NumPy arrays both work)
+        """
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+        self.histograms[name].extend(values)
+    
     def get_histogram_stats(self, name: str) -> Dict[str, float]:
         """
         Get statistics for a histogram
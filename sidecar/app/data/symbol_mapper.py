@@ -1,5 +1,6 @@
 """Symbol mapper for converting between broker symbols"""
 
+from functools import lru_cache
 from typing import Dict, Optional
 from loguru import logger
 
@@ -16,15 +17,17 @@ class SymbolMapper:
             "GOLD": "XAUUSD",
             "EURUSD": "EURUSD",
         }
+        # Normalization is pure and runs per bar per provider: memoize per instance
+        self.normalize_symbol = lru_cache(maxsize=512)(self._normalize_symbol)
         logger.info("SymbolMapper initialized")
     
     def map_symbol(self, symbol: str) -> str:
         """Map a symbol to its alternative format"""
         return self.mappings.get(symbol, symbol)
     
-    def normalize_symbol(self, symbol: str) -> str:
-        """Normalize symbol to standard format"""
-        symbol = symbol.upper().strip()
+    def _normalize_symbol(self, symbol: str) -> str:
+        """Normalize symbol to standard format (cached as normalize_symbol)"""
+        symbol = str(symbol).upper().strip()
         # Remove common suffixes
         for suffix in [".a", ".b", "_", "-"]:
             symbol = symbol.replace(suffix, "")
@@ -7,6 +7,7 @@ import aiosqlite
 import logging
 import os
 import json
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
 
@@ -32,16 +33,27 @@ class UserDB:
     """
     Async SQLite wrapper for User Data.
     """
-    def __init__(self):
-        self.db_path = DB_PATH
-        self._ensure_dir()
+    def __init__(self, db_path: str = DB_PATH, uri: bool = False, pragmas: Optional[List[str]] = None):
+        self.db_path = db_path
+        self.uri = uri            # db_path is a sqlite URI, e.g. "file:name?mode=memory&cache=shared"
+        self.pragmas = pragmas or []
+        if not uri:
+            self._ensure_dir()
 
     def _ensure_dir(self):
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
+    @asynccontextmanager
+    async def _connect(self):
+        """Open a connection and apply the configured PRAGMAs."""
+        async with aiosqlite.connect(self.db_path, uri=self.uri) as db:
+            for pragma in self.pragmas:
+                await db.execute(f"PRAGMA {pragma}")
+            yield db
+
     async def init_db(self):
         """Initialize database tables."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             # Users Table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS users (
@@ -84,7 +96,7 @@ class UserDB:
 
     async def save_prop_config(self, user_id: int, config: PropFirmConfig, rules: PropRules):
         """Save Prop Firm credentials and rules."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             # Insert/Update Firm
             cursor = await db.execute("""
                 INSERT INTO prop_firms (user_id, firm_name, login, password, server)
@@ -105,7 +117,7 @@ class UserDB:
 
     async def get_active_config(self):
         """Get the currently active prop firm config and rules."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             # Get latest active firm
             async with db.execute("""
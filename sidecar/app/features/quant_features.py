@@ -8,6 +8,61 @@ import pandas as pd
 from typing import Dict, Tuple, Optional
 from scipy.fft import fft
 
+from app.core.jit import njit, prange
+
+
+@njit("float64[:](float64[::1], int64)", cache=True)
+def _lagged_diff_tau(values, max_lag):
+    """sqrt(std(x[lag:] - x[:-lag])) for lag in [2, max_lag)"""
+    n_lags = max(max_lag - 2, 0)
+    tau = np.empty(n_lags)
+    for i in range(n_lags):
+        lag = i + 2
+        tau[i] = np.sqrt(np.std(values[lag:] - values[:-lag]))
+    return tau
+
+
+@njit(cache=True)
+def _hurst_from_values(values, max_lag):
+    """Hurst estimate from clean values; log-log slope fitted by least squares"""
+    max_lag = min(max_lag, len(values) - 1)
+    tau = _lagged_diff_tau(values, max(max_lag, 2))
+    
+    n = 0
+    sx = sy = sxx = sxy = 0.0
+    for i in range(len(tau)):
+        if tau[i] > 0:
+            x = np.log(i + 2.0)
+            y = np.log(tau[i])
+            n += 1
+            sx += x
+            sy += y
+            sxx += x * x
+            sxy += x * y
+    
+    denom = n * sxx - sx * sx
+    if n < 2 or denom == 0:
+        return 0.5
+    hurst = 2.0 * (n * sxy - sx * sy) / denom
+    return max(0.0, min(1.0, hurst))
+
+
+@njit(cache=True, parallel=True)
+def _hurst_batch(data, max_lag):
+    """Row-wise Hurst exponent; non-finite values are dropped per row"""
+    out = np.empty(data.shape[0])
+    for r in prange(data.shape[0]):
+        row = data[r]
+        out[r] = _hurst_from_values(np.ascontiguousarray(row[np.isfinite(row)]), max_lag)
+    return out
+
+
+def _clean_values(series) -> np.ndarray:
+    """Contiguous float64 buffer with NaN/Inf dropped (JIT kernels assume clean input)"""
+    values = np.ascontiguousarray(np.asarray(series, dtype=np.float64))
+    return np.ascontiguousarray(values[np.isfinite(values)])
+
+
 class QuantFeatureEngineer:
     """
     Calculates advanced math features: Hurst Exponent, FFT Cycles.
@@ -22,8 +77,15 @@ class QuantFeatureEngineer:
         H > 0.5: Trending (Persistent)
         """
         try:
-            lags = range(2, max_lag)
-            tau = [np.sqrt(np.std(np.subtract(series[lag:], series[:-lag]))) for lag in lags]
+            values = _clean_values(series)
+            # Each lag needs at least two differences
+            max_lag = min(max_lag, len(values) - 1)
+            lags = np.arange(2, max(max_lag, 2))
+            tau = _lagged_diff_tau(values, max_lag)
+            
+            # log(0) is undefined; flat stretches carry no information
+            valid = tau > 0
+            lags, tau = lags[valid], tau[valid]
             
             # Use linear regression to estimate the slope of the log-log plot
             # polyfit returns [slope, intercept]
@@ -45,6 +107,15 @@ class QuantFeatureEngineer:
         except Exception:
             return 0.5
 
+    @staticmethod
+    def calculate_hurst_exponent_batch(data: np.ndarray, max_lag: int = 20) -> np.ndarray:
+        """
+        Hurst Exponent for each row of a (n_series, n_points) array.
+        NaN/Inf entries are ignored; rows without enough data score 0.5.
+        """
+        data = np.ascontiguousarray(np.atleast_2d(data), dtype=np.float64)
+        return _hurst_batch(data, max_lag)
+
     @staticmethod
     def calculate_fft_cycle(series: pd.Series) -> Tuple[float, float]:
         """
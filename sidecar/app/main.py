@@ -10,6 +10,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
 
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 from app.core import settings
 from app.data.database import db
 from app.data.redis_client import redis_client
@@ -127,6 +133,7 @@ app = FastAPI(
     description="Memory-Adaptive Prop Trading System - AI Service",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None,
 )
@@ -5,11 +5,23 @@ from typing import Dict, Optional, Tuple
 from loguru import logger
 import time
 
+from app.core.jit import njit
 from app.ml.random_forest import random_forest
 from app.ml.lstm_model import lstm_model
 from app.ml.onnx_exporter import onnx_exporter
 from app.features.feature_engineer import feature_engineer
 
+# Explicit signature: compiled when the module is imported (or loaded from
+# the on-disk cache), so the first predict() does not pay for the JIT
+@njit("float32[:](float32[:])", cache=True)
+def _build_feature_vec(raw):
+    """Copy of raw with NaN/Inf replaced by 0.0 (models assume finite input)"""
+    out = np.empty_like(raw)
+    for i in range(raw.shape[0]):
+        v = raw[i]
+        out[i] = v if np.isfinite(v) else 0.0
+    return out
+
 
 class MLInference:
     """ML inference engine combining all models"""
@@ -172,6 +184,7 @@ class MLInference:
             feature_vector = await feature_engineer.get_feature_vector(symbol)
             if feature_vector is None:
                 return None
+            feature_vector = _build_feature_vec(np.asarray(feature_vector, dtype=np.float32))
             
             predictions = {}
             
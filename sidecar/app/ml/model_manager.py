@@ -1,19 +1,88 @@
 """ML model manager"""
 
+import numpy as np
 from loguru import logger
 
 
+class ONNXClassifier:
+    """
+    sklearn-style predict()/predict_proba() over an ONNX Runtime session
+    
+    Works with both skl2onnx output layouts: a probability tensor
+    (zipmap=False, what onnx_exporter writes now) and the older ZipMap
+    sequence of {label: probability} dicts found in previously cached models.
+    """
+    
+    def __init__(self, session):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+        # skl2onnx names the outputs label/probabilities, or
+        # output_label/output_probability when a ZipMap is appended
+        label, proba = session.get_outputs()[:2]
+        self.label_name = label.name
+        self.proba_name = proba.name
+        self.zipmap = proba.type.startswith('seq(')
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predicted labels (1 = TP, 0 = SL)"""
+        X = np.asarray(X, dtype=np.float32)
+        return self.session.run([self.label_name], {self.input_name: X})[0]
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Probability of TP (P_win)"""
+        X = np.asarray(X, dtype=np.float32)
+        proba = self.session.run([self.proba_name], {self.input_name: X})[0]
+        if self.zipmap:
+            return np.array([row[1] for row in proba], dtype=np.float32)
+        return proba[:, 1]
+
+
 class ModelManager:
     """Manages ML model loading and inference"""
     
     def __init__(self):
         self.models = {}
+        self.rf_model = None
+        self.rf_batch_model = None  # parallel batch scoring, see BatchRFPredictor
         logger.info("ModelManager initialized")
     
     async def load_models(self) -> bool:
-        """Load ML models"""
-        logger.info("ML models loading skipped (stub implementation)")
-        return True
+        """
+        Load ML models
+        
+        The Random Forest is served through ONNX Runtime when it is installed:
+        the cached random_forest.onnx is used if present, otherwise the trained
+        sklearn model is converted once and cached to disk. Without ONNX the
+        sklearn model is used directly.
+        """
+        try:
+            from app.ml.random_forest import random_forest, BatchRFPredictor
+            from app.ml.onnx_exporter import onnx_exporter, ONNX_AVAILABLE
+        except Exception as e:
+            logger.warning(f"ML models unavailable: {e}")
+            return False
+        
+        rf_loaded = random_forest.load()
+        
+        if ONNX_AVAILABLE:
+            if onnx_exporter.rf_session is None and rf_loaded:
+                onnx_exporter.export_random_forest(
+                    n_features=random_forest.model.n_features_in_,
+                    model=random_forest.model
+                )
+            if onnx_exporter.rf_session is not None:
+                self.rf_model = ONNXClassifier(onnx_exporter.rf_session)
+                logger.info("✓ Random Forest served by ONNX Runtime")
+        
+        if self.rf_model is None and rf_loaded:
+            self.rf_model = random_forest
+            logger.info("✓ Random Forest served by scikit-learn")
+        
+        if rf_loaded:
+            self.rf_batch_model = BatchRFPredictor(random_forest.model)
+        
+        self.models['random_forest'] = self.rf_model
+        return self.rf_model is not None
 
 
 # Global instance
@@ -38,30 +38,40 @@ class ONNXExporter:
         if ONNX_AVAILABLE:
             self.load_sessions()
     
-    def export_random_forest(self, model_path: Path = None, n_features: int = 50) -> bool:
+    def export_random_forest(self, model_path: Path = None, n_features: int = 50, model=None) -> bool:
         """
         Convert scikit-learn Random Forest to ONNX
+        
+        Converts `model` when given (an already-loaded estimator), otherwise
+        the joblib file at `model_path`.
         """
         if not ONNX_AVAILABLE:
             logger.warning("Cannot export RF: ONNX not available")
             return False
 
         try:
-            if model_path is None:
-                model_path = Path(settings.models_dir) / "random_forest.joblib"
-            
-            if not model_path.exists():
-                logger.warning(f"RF model not found at {model_path}")
-                return False
-            
-            # Load sklearn model
-            rf_model = joblib.load(model_path)
+            if model is not None:
+                rf_model = model
+            else:
+                if model_path is None:
+                    model_path = Path(settings.models_dir) / "random_forest.joblib"
+                
+                if not model_path.exists():
+                    logger.warning(f"RF model not found at {model_path}")
+                    return False
+                
+                # Load sklearn model
+                rf_model = joblib.load(model_path)
             
             # Define input type
             initial_type = [('float_input', FloatTensorType([None, n_features]))]
             
-            # Convert
-            onnx_model = convert_sklearn(rf_model, initial_types=initial_type)
+            # Convert; plain probability tensor instead of a list of dicts (ZipMap)
+            onnx_model = convert_sklearn(
+                rf_model,
+                initial_types=initial_type,
+                options={id(rf_model): {'zipmap': False}}
+            )
             
             # Save
             with open(self.rf_onnx_path, "wb") as f:
@@ -144,6 +154,19 @@ class ONNXExporter:
             logger.error(f"Error exporting LSTM to ONNX: {e}", exc_info=True)
             return False
     
+    @staticmethod
+    def _session_options():
+        """
+        Single-threaded session options
+        
+        Inference runs on batches of one, where spreading a request over
+        ORT's thread pool costs more than it saves.
+        """
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        return options
+    
     def load_sessions(self) -> bool:
         """Load ONNX inference sessions"""
         if not ONNX_AVAILABLE:
@@ -155,6 +178,7 @@ class ONNXExporter:
             if self.rf_onnx_path.exists():
                 self.rf_session = ort.InferenceSession(
                     str(self.rf_onnx_path),
+                    sess_options=self._session_options(),
                     providers=['CPUExecutionProvider']
                 )
                 logger.info(f"✓ RF ONNX session loaded")
@@ -165,6 +189,7 @@ class ONNXExporter:
             if self.lstm_onnx_path.exists():
                 self.lstm_session = ort.InferenceSession(
                     str(self.lstm_onnx_path),
+                    sess_options=self._session_options(),
                     providers=['CPUExecutionProvider']
                 )
                 logger.info(f"✓ LSTM ONNX session loaded")
@@ -9,6 +9,28 @@ from pathlib import Path
 from typing import Tuple, Optional, Dict
 from loguru import logger
 from app.core import settings
+from app.core.jit import njit, prange
+
+
+# Compiled on the first batch (or loaded from the on-disk cache), not at
+# import: a parallel kernel starts Numba's worker pool, and one started off the
+# main thread blocks interpreter shutdown for whoever imported this module
+@njit(cache=True, parallel=True)
+def _score_batch(X, roots, feature, threshold, left, right, leaf_value, out):
+    """Mean leaf P(TP) over all trees for each row of X; rows run in parallel"""
+    n_trees = roots.shape[0]
+    for i in prange(X.shape[0]):
+        total = 0.0
+        for t in range(n_trees):
+            node = roots[t]
+            while left[node] != -1:
+                if X[i, feature[node]] <= threshold[node]:
+                    node = left[node]
+                else:
+                    node = right[node]
+            total += leaf_value[node]
+        out[i] = total / n_trees
+    return out
 
 
 class RandomForestModel:
@@ -181,5 +203,50 @@ class RandomForestModel:
         }
 
 
+class BatchRFPredictor:
+    """
+    Batch scoring of a fitted forest through a parallel Numba kernel
+    
+    The trees are flattened once into contiguous node arrays, and
+    predict_proba() walks every tree per row with rows spread over threads.
+    Meant for batches; single rows stay on RandomForestModel, where the
+    kernel dispatch would cost more than it saves.
+    """
+    
+    def __init__(self, model: RandomForestClassifier):
+        trees = [est.tree_ for est in model.estimators_]
+        sizes = np.array([tree.node_count for tree in trees])
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        
+        self.roots = offsets.astype(np.int32)
+        self.feature = np.concatenate([tree.feature for tree in trees]).astype(np.int32)
+        # float64 thresholds, compared against float32 rows as sklearn does
+        self.threshold = np.concatenate([tree.threshold for tree in trees])
+        # Child ids shifted into the flat arrays; -1 still marks a leaf
+        self.left = np.concatenate([
+            np.where(tree.children_left == -1, -1, tree.children_left + offset)
+            for tree, offset in zip(trees, offsets)
+        ]).astype(np.int32)
+        self.right = np.concatenate([
+            np.where(tree.children_right == -1, -1, tree.children_right + offset)
+            for tree, offset in zip(trees, offsets)
+        ]).astype(np.int32)
+        # Per-node P(class 1); value holds counts or fractions depending on sklearn version
+        values = np.concatenate([tree.value[:, 0, :] for tree in trees])
+        self.leaf_value = values[:, 1] / values.sum(axis=1)
+        self.classes = model.classes_
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Probability of TP (P_win) per row"""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        out = np.empty(X.shape[0])
+        return _score_batch(X, self.roots, self.feature, self.threshold,
+                            self.left, self.right, self.leaf_value, out)
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predicted labels (1 = TP, 0 = SL)"""
+        return self.classes[(self.predict_proba(X) > 0.5).astype(np.intp)]
+
+
 # Global Random Forest instance
 random_forest = RandomForestModel()
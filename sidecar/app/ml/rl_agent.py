@@ -55,10 +55,13 @@ class PPOAgent:
 
     def select_action(self, state):
         """
-        state: [PnL, Volatility, RSI, MACD, TimeHeld]
+        state: [PnL, Volatility, RSI, MACD, TimeHeld] as a list or float tensor
         """
         try:
-            state_tensor = torch.FloatTensor(state).to(self.device)
+            if isinstance(state, torch.Tensor):
+                state_tensor = state.to(self.device, dtype=torch.float32, non_blocking=True)
+            else:
+                state_tensor = torch.FloatTensor(state).to(self.device)
             with torch.no_grad():
                 action_probs = self.policy.act(state_tensor)
             
@@ -7,6 +7,11 @@ from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 from loguru import logger
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 
 class SyntheticDataGenerator:
     """
@@ -137,7 +142,10 @@ class SyntheticDataGenerator:
             symbols: List of symbols to use
         
         Returns:
-            List of trade dicts with features, outcomes, and PnL
+            List of trade dicts with features, outcomes, and PnL.
+            Each sample carries the features both as a dict ('features')
+            and as JSON ('features_json') for persistence, plus its row of
+            a preallocated (n_samples, 50) matrix ('feature_vector').
         """
         if symbols is None:
             symbols = ['NAS100', 'XAUUSD', 'EURUSD']
@@ -145,6 +153,8 @@ class SyntheticDataGenerator:
         logger.info(f"Generating {n_samples} synthetic trade samples...")
         
         samples = []
+        n_features = min(len(self.feature_names), 50)
+        feature_matrix = np.zeros((n_samples, 50), dtype=np.float64)
         
         # Distribute timestamps over last 30 days
         end_time = datetime.utcnow()
@@ -157,8 +167,13 @@ class SyntheticDataGenerator:
             # Random symbol
             symbol = np.random.choice(symbols)
             
-            # Generate realistic features
-            features = self._generate_realistic_features(symbol)
+            # Generate realistic features (plain floats so they serialize)
+            features = {
+                name: float(value)
+                for name, value in self._generate_realistic_features(symbol).items()
+            }
+            row = feature_matrix[i]
+            row[:n_features] = [features[name] for name in self.feature_names[:n_features]]
             
             # Determine outcome based on feature quality
             exit_reason, pnl = self._determine_outcome(features)
@@ -166,7 +181,9 @@ class SyntheticDataGenerator:
             # Create sample
             sample = {
                 'symbol': symbol,
+                'features': features,
                 'features_json': json.dumps(features),
+                'feature_vector': row,
                 'exit_reason': exit_reason,
                 'pnl': pnl,
                 'timestamp': int(timestamp.timestamp()),
@@ -347,6 +364,33 @@ class SyntheticDataGenerator:
         
         return vector[:50]
     
+    def get_feature_matrix(self, samples: list[Dict]) -> np.ndarray:
+        """
+        Convert a batch of samples to a feature matrix
+        
+        Fills a preallocated float32 matrix one feature column at a time
+        instead of building one vector per sample.
+        
+        Args:
+            samples: Samples with a 'features' dict (or 'features_json')
+        
+        Returns:
+            (n_samples, 50) float32 matrix
+        """
+        n = len(samples)
+        out = np.zeros((n, 50), dtype=np.float32)
+        feature_dicts = [
+            s['features'] if 'features' in s else _loads(s['features_json'])
+            for s in samples
+        ]
+        
+        for k, name in enumerate(self.feature_names[:50]):
+            out[:, k] = np.fromiter(
+                (f.get(name, 0.0) for f in feature_dicts), dtype=np.float32, count=n
+            )
+        
+        return out
+    
     def validate_samples(self, samples: list[Dict]) -> Dict:
         """
         Validate generated samples for quality
@@ -371,7 +415,7 @@ class SyntheticDataGenerator:
         # Check feature validity
         try:
             for sample in samples[:10]:  # Check first 10
-                features = json.loads(sample['features_json'])
+                features = sample.get('features') or _loads(sample['features_json'])
                 vector = self.get_feature_vector(features)
                 if len(vector) != 50:
                     return {'valid': False, 'reason': 'Invalid feature vector length'}
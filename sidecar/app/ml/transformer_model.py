@@ -77,10 +77,17 @@ class TransformerPredictor:
 
     def predict(self, features_sequence):
         """
-        features_sequence: List of feature vectors (seq_len, input_dim)
+        features_sequence: List of feature vectors (seq_len, input_dim), or a
+        float tensor of shape (seq_len, input_dim) / (1, seq_len, input_dim).
+        Tensors skip the list conversion; pinned CPU tensors copy to the GPU
+        asynchronously.
         """
         try:
-            tensor = torch.FloatTensor(features_sequence).unsqueeze(0).to(self.device) # [1, seq, dim]
+            if isinstance(features_sequence, torch.Tensor):
+                tensor = features_sequence if features_sequence.dim() == 3 else features_sequence.unsqueeze(0)
+                tensor = tensor.to(self.device, dtype=torch.float32, non_blocking=True)
+            else:
+                tensor = torch.FloatTensor(features_sequence).unsqueeze(0).to(self.device) # [1, seq, dim]
             with torch.no_grad():
                 pred = self.model(tensor)
             return pred.item()
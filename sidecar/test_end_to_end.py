@@ -292,12 +292,22 @@ async def test_end_to_end():
             metrics.set_gauge("test_gauge", 42.0)
             metrics.record_value("test_hist", 100.0)
             
+            # Batched ingest path (one call per loop iteration)
+            batch = {f"k{i}": 1 for i in range(1000)}
+            batch["test"] = 5
+            bulk_start = time.perf_counter()
+            metrics.bulk_increment(batch)
+            metrics.record_values("test_hist", [110.0, 120.0, 130.0])
+            bulk_ms = (time.perf_counter() - bulk_start) * 1000
+            
             count = metrics.get_counter("test")
             gauge = metrics.get_gauge("test_gauge")
+            hist = metrics.get_histogram_stats("test_hist")
             
-            if count == 5 and gauge == 42.0:
+            if count == 10 and gauge == 42.0 and hist["count"] == 4 and metrics.get_counter("k999") == 1:
                 print(f"{Colors.GREEN}✓ Metrics collector working{Colors.END}")
                 print(f"{Colors.BLUE}  Counter: {count}, Gauge: {gauge}{Colors.END}")
+                print(f"{Colors.BLUE}  Bulk increment of {len(batch)} counters: {bulk_ms:.3f}ms{Colors.END}")
                 tests_passed += 1
             else:
                 print(f"{Colors.RED}✗ Metrics values incorrect{Colors.END}")
@@ -23,13 +23,18 @@ PRODUCTION-GRADE TESTING - ZERO TOLERANCE FOR FAILURES
 """
 
 import sys
-import asyncio
+import io
+import argparse
 import time
 import tracemalloc
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Callable, Optional
 import gc
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 # Color codes
 class Colors:
     GREEN = '\033[92m'
@@ -75,41 +80,355 @@ def print_metric(name: str, value: Any, unit: str = "", level: int = 0):
     indent = "  " * level
     print(f"{indent}{Colors.MAGENTA}📊 {name}: {value}{unit}{Colors.END}")
 
+# Pre-built result line prefixes for the record_test hot path
+_INDENTS = tuple("  " * level for level in range(8))
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓ "
+_ERROR_PREFIX = f"{Colors.RED}✗ "
+
+
+# Test categories, numbered as in the module docstring
+CATEGORIES = {
+    1: "Component initialization and teardown",
+    2: "Data validation edge cases",
+    3: "Symbol mapping all combinations",
+    4: "Circuit breaker all state transitions",
+    5: "Metrics collection accuracy",
+    6: "Redis operations under load",
+    7: "SQLite concurrent operations",
+    8: "Feature engine accuracy",
+    9: "Data fetcher error handling",
+    10: "End-to-end integration with real data",
+    11: "Performance benchmarks",
+    12: "Memory leak detection",
+    13: "Concurrency stress tests",
+    14: "Error recovery scenarios",
+    15: "Data integrity verification",
+}
+
+# Categories run per --mode; smoke covers the cheap checks for the edit loop
+MODES = {
+    'smoke': frozenset(range(1, 6)),
+    'full': frozenset(CATEGORIES),
+    'leak-only': frozenset({12}),
+    'stress-only': frozenset({6, 7, 11, 13}),
+}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Exhaustive data pipeline validation")
+    parser.add_argument('--mode', choices=sorted(MODES), default='full',
+                        help='Which test categories to run (smoke = categories 1-5)')
+    parser.add_argument('--deep-leak-check', action='store_true',
+                        help='Trace allocations with tracemalloc (slow) and rank leaking allocation sites')
+    parser.add_argument('--verbose', action='store_true', help='Show details for passing tests')
+    return parser.parse_args(argv)
+
+
+def get_peak_rss_bytes() -> int:
+    """Peak resident set size of this process (0 if unavailable)"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """tracemalloc snapshot without the tracer's own bookkeeping"""
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+
 
 class ExhaustivePipelineValidator:
-    """Most comprehensive pipeline validation possible"""
+    """
+    Most comprehensive pipeline validation possible
+    
+    Use as a context manager: GC tuning is applied on entry and always
+    restored on exit.
+    """
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False, deep_leak_check: bool = False, mode: str = 'full'):
         self.tests_passed = 0
         self.tests_failed = 0
         self.tests_total = 0
         self.start_time = time.time()
         self.test_results = []
         self.performance_metrics = {}
+        self.verbose = verbose
+        self.mode = mode
+        self.categories = MODES[mode]
         
-        # Start memory tracking
-        tracemalloc.start()
-        self.initial_memory = tracemalloc.get_traced_memory()[0]
+        # Result lines are buffered and written once per section
+        self._out = io.StringIO()
+        self._gc_threshold = None
         
-    def record_test(self, passed: bool, test_name: str, details: str = "", level: int = 1):
-        """Record test result with details"""
+        # Memory tracking: by default only sample the RSS high-water mark,
+        # which is free; tracemalloc slows the whole run down considerably
+        # and is reserved for --deep-leak-check.
+        self.deep_leak_check = deep_leak_check
+        self.initial_memory = get_peak_rss_bytes()
+        self.memory_high_water = self.initial_memory
+        self.memory_crossings: List[Tuple[str, int]] = []
+        self._last_snapshot = None
+        self._site_samples = 0
+        self._site_growth: Dict[Any, int] = {}
+        self._current_section = "startup"
+    
+    def __enter__(self):
+        # Move everything allocated so far (imported modules, global
+        # singletons) to the permanent generation so the GC stops rescanning
+        # it, and collect less often under bursty short-lived test allocations.
+        gc.collect()
+        gc.freeze()
+        self._gc_threshold = gc.get_threshold()
+        gc.set_threshold(50000, 20, 20)
+        
+        if self.deep_leak_check:
+            tracemalloc.start()
+            self._last_snapshot = _take_snapshot()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def close(self):
+        """Restore GC settings and stop allocation tracing"""
+        self.flush_output()
+        if self._gc_threshold is not None:
+            gc.set_threshold(*self._gc_threshold)
+            gc.unfreeze()
+            self._gc_threshold = None
+        if self.deep_leak_check and tracemalloc.is_tracing():
+            tracemalloc.stop()
+    
+    def should_run(self, category: int) -> bool:
+        """Whether a test category (see CATEGORIES) is enabled in this mode"""
+        return category in self.categories
+    
+    def sample_memory(self, label: str = ""):
+        """
+        Sample memory usage at a checkpoint (e.g. after each section)
+        
+        Records RSS high-water crossings; in deep mode also diffs a
+        tracemalloc snapshot against the previous one and counts, per
+        allocation site, how many intervals its live block count grew.
+        """
+        peak = get_peak_rss_bytes()
+        if peak > self.memory_high_water:
+            self.memory_high_water = peak
+            self.memory_crossings.append((label, peak))
+        
+        if not self.deep_leak_check:
+            return
+        
+        snapshot = _take_snapshot()
+        self._site_samples += 1
+        for stat in snapshot.compare_to(self._last_snapshot, 'lineno'):
+            if stat.count_diff > 0:
+                site = stat.traceback[0]
+                self._site_growth[site] = self._site_growth.get(site, 0) + 1
+        self._last_snapshot = snapshot
+    
+    def leak_scores(self, top: int = 10) -> List[Tuple[Any, float]]:
+        """
+        Rank allocation sites by leak likelihood (deep mode only)
+        
+        Uses Laplace's rule of succession: a site that grew in g of n
+        sampled intervals scores (g + 1) / (n + 2).
+        """
+        n = self._site_samples
+        scores = [(site, (grew + 1) / (n + 2)) for site, grew in self._site_growth.items()]
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return scores[:top]
+        
+    def record_test(self, passed: bool, test_name: str, details: str = "", level: int = 1,
+                    details_fn: Optional[Callable[[], str]] = None):
+        """
+        Record test result with details
+        
+        details_fn is only evaluated for failures or in verbose mode, so
+        expensive diagnostics cost nothing on the passing path.
+        """
         self.tests_total += 1
-        result = {
+        if details_fn is not None and (not passed or self.verbose):
+            details = details_fn()
+        self.test_results.append({
             'name': test_name,
             'passed': passed,
             'details': details,
-            'timestamp': datetime.now()
-        }
-        self.test_results.append(result)
+            'timestamp_ns': time.monotonic_ns()
+        })
         
         if passed:
             self.tests_passed += 1
-            print_success(f"{test_name} {details}", level)
+            prefix = _SUCCESS_PREFIX
         else:
             self.tests_failed += 1
-            print_error(f"{test_name} {details}", level)
+            prefix = _ERROR_PREFIX
+        self._out.write("".join((_INDENTS[level], prefix, test_name, " ", details, Colors.END, "\n")))
+    
+    def flush_output(self):
+        """Write buffered result lines to stdout (call at the end of each section)"""
+        sys.stdout.write(self._out.getvalue())
+        sys.stdout.flush()
+        self._out.seek(0)
+        self._out.truncate()
+    
+    def section(self, text: str):
+        """Flush the previous section's results and start a new section"""
+        self.sample_memory(self._current_section)
+        self.flush_output()
+        self._current_section = text
+        print_section(text)
+    
+    def print_summary(self):
+        """Print totals, memory high-water crossings and (deep mode) leak suspects"""
+        self.sample_memory(self._current_section)
+        self.flush_output()
+        
+        print_header("SUMMARY")
+        print_metric("Tests passed", f"{self.tests_passed}/{self.tests_total}")
+        print_metric("Duration", f"{time.time() - self.start_time:.2f}", "s")
+        
+        if self.initial_memory:
+            growth_mb = (self.memory_high_water - self.initial_memory) / (1024 * 1024)
+            print_metric("Peak RSS growth", f"{growth_mb:.1f}", " MB")
+            for label, peak in self.memory_crossings:
+                print_info(f"New RSS peak {peak / (1024 * 1024):.1f} MB after: {label}", 1)
+        
+        if self.deep_leak_check:
+            print_section(f"Leak suspects ({self._site_samples} sampled intervals)")
+            for site, score in self.leak_scores():
+                print_warning(f"{site.filename}:{site.lineno} P(leak)={score:.2f}", 1)
+        
+        if self.tests_failed:
+            print_error(f"{self.tests_failed} test(s) failed")
+        else:
+            print_success("All tests passed")
     
     def record_metric(self, name: str, value: float, unit: str = ""):
         """Record performance metric"""
         self.performance_metrics[name] = {'value': value, 'unit': unit}
-        print_metric(name, f"{value:.2f}", unit, level=1)
+        # Buffered with the test lines so metrics stay in section order
+        self._out.write(f"{_INDENTS[1]}{Colors.MAGENTA}📊 {name}: {value:.2f}{unit}{Colors.END}\n")
+    
+    # ===== Test categories =====
+    
+    def test_symbol_mapping(self):
+        """[3] Symbol mapping all combinations"""
+        from app.data.symbol_mapper import SymbolMapper
+        
+        mapper = SymbolMapper()
+        for symbol, alternative in mapper.mappings.items():
+            self.record_test(mapper.map_symbol(symbol) == alternative,
+                             f"map_symbol({symbol})", f"-> {alternative}")
+            # Every alternative maps back to the symbol it came from
+            self.record_test(mapper.map_symbol(alternative) == symbol,
+                             f"map_symbol round trip ({symbol})",
+                             details_fn=lambda a=alternative: f"got {mapper.map_symbol(a)}")
+        self.record_test(mapper.map_symbol("UNKNOWN") == "UNKNOWN", "Unmapped symbol passes through")
+        
+        for raw, expected in (("us100-", "US100"), (" nas100 ", "NAS100"), ("XAUUSD_", "XAUUSD")):
+            self.record_test(mapper.normalize_symbol(raw) == expected,
+                             f"normalize_symbol({raw!r})", f"-> {expected}")
+        before = mapper.normalize_symbol.cache_info().hits
+        mapper.normalize_symbol("us100-")
+        self.record_test(mapper.normalize_symbol.cache_info().hits == before + 1,
+                         "Repeated normalization served from cache")
+    
+    def test_metrics_collection(self):
+        """[5] Metrics collection accuracy"""
+        from app.core.metrics import MetricsCollector
+        
+        metrics = MetricsCollector(window_size=100)
+        metrics.increment_counter("c", 5)
+        metrics.bulk_increment({"c": 3, "d": 1})
+        self.record_test(metrics.get_counter("c") == 8 and metrics.get_counter("d") == 1,
+                         "Counters and bulk increments")
+        
+        metrics.set_gauge("g", 42.5)
+        self.record_test(metrics.get_gauge("g") == 42.5, "Gauge set/get")
+        
+        metrics.record_values("h", range(10, 110, 10))
+        stats = metrics.get_histogram_stats("h")
+        self.record_test(
+            (stats["count"], stats["min"], stats["max"], stats["mean"]) == (10, 10, 100, 55.0),
+            "Histogram statistics", details_fn=lambda: str(stats))
+        
+        metrics.record_api_call("yahoo", True, 50.0)
+        metrics.record_api_call("yahoo", False, 200.0)
+        self.record_test(
+            (metrics.get_counter("api_calls_yahoo_success"),
+             metrics.get_counter("api_calls_yahoo_failure")) == (1, 1),
+            "API call success/failure counters")
+    
+    def test_performance(self):
+        """[11] Performance benchmarks (reported, not asserted)"""
+        from app.data.symbol_mapper import SymbolMapper
+        from app.core.metrics import MetricsCollector
+        
+        mapper = SymbolMapper()
+        n = 100_000
+        start = time.perf_counter()
+        for _ in range(n):
+            mapper.normalize_symbol("us100-")
+        self.record_metric("normalize_symbol (cached)", (time.perf_counter() - start) / n * 1e9, " ns/call")
+        
+        metrics = MetricsCollector(window_size=1000)
+        start = time.perf_counter()
+        for i in range(n):
+            metrics.record_value("latency", float(i))
+        self.record_metric("MetricsCollector.record_value", (time.perf_counter() - start) / n * 1e9, " ns/call")
+    
+    def test_memory_bounds(self):
+        """[12] Memory leak detection"""
+        from app.core.metrics import MetricsCollector
+        
+        # Histograms are sliding windows: sustained recording must not grow them
+        metrics = MetricsCollector(window_size=100)
+        for _ in range(1000):
+            metrics.record_values("latency", range(100))
+        size = len(metrics.histograms["latency"])
+        self.record_test(size == 100, "Histogram window stays bounded", f"({size} samples)")
+        
+        gc.collect()
+        self.record_test(not gc.garbage, "No uncollectable objects", details_fn=lambda: f"{len(gc.garbage)} in gc.garbage")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the selected test categories and return a process exit code"""
+    args = parse_args(argv)
+    
+    with ExhaustivePipelineValidator(verbose=args.verbose,
+                                     deep_leak_check=args.deep_leak_check,
+                                     mode=args.mode) as v:
+        print_header(f"EXHAUSTIVE PIPELINE VALIDATION ({args.mode})")
+        
+        # Categories whose components exist in this tree
+        suite = {
+            3: v.test_symbol_mapping,
+            5: v.test_metrics_collection,
+            11: v.test_performance,
+            12: v.test_memory_bounds,
+        }
+        for n in sorted(CATEGORIES):
+            if not v.should_run(n):
+                continue
+            if n not in suite:
+                print_warning(f"[{n}] {CATEGORIES[n]}: no checks implemented yet")
+                continue
+            v.section(f"[{n}] {CATEGORIES[n]}")
+            try:
+                suite[n]()
+            except Exception as e:
+                v.record_test(False, f"Category {n} crashed", f"{type(e).__name__}: {e}")
+        
+        v.print_summary()
+        return 1 if v.tests_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
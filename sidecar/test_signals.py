@@ -2,8 +2,6 @@
 """Test signals endpoint"""
 
 import asyncio
-import sys
-sys.path.insert(0, '/home/ubuntu/Sandeep/projects/Vproptrader/sidecar')
 
 async def test_signals():
     """Test the signals endpoint"""
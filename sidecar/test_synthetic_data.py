@@ -1,10 +1,15 @@
 """Test script for synthetic training data generator"""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
-import json
 import numpy as np
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 # Add app to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -12,6 +17,12 @@ from app.ml.synthetic_data_generator import synthetic_data_generator
 from loguru import logger
 
 
+@lru_cache(maxsize=None)
+def _generate_samples(n_samples: int) -> tuple:
+    """Generate synthetic samples once per size and reuse across tests"""
+    return tuple(synthetic_data_generator.generate_trade_samples(n_samples=n_samples))
+
+
 def test_synthetic_data_generation():
     """Test synthetic data generation"""
     
@@ -20,8 +31,11 @@ def test_synthetic_data_generation():
     logger.info("=" * 60)
     
     # Test 1: Generate samples
+    # The 1000-sample production set is generated once; the first 100
+    # samples double as the small-sample set.
     logger.info("\n1. Generating 100 synthetic trade samples...")
-    samples = synthetic_data_generator.generate_trade_samples(n_samples=100)
+    large_samples = list(_generate_samples(1000))
+    samples = large_samples[:100]
     
     if not samples:
         logger.error("✗ Failed to generate samples")
@@ -44,13 +58,16 @@ def test_synthetic_data_generation():
     # Test 3: Check feature structure
     logger.info("\n3. Checking feature structure...")
     sample = samples[0]
-    features = json.loads(sample['features_json'])
+    features = sample['features']
     
     logger.info(f"  Features count: {len(features)}")
     logger.info(f"  Sample features: {list(features.keys())[:5]}...")
     
-    # Convert to vector
-    vector = synthetic_data_generator.get_feature_vector(features)
+    # Feature vector is materialized at generation time
+    vector = sample['feature_vector']
+    if not np.array_equal(vector, synthetic_data_generator.get_feature_vector(features)):
+        logger.error("✗ Precomputed feature vector does not match features dict")
+        return False
     logger.info(f"  Feature vector shape: {vector.shape}")
     logger.info(f"  Feature vector range: [{vector.min():.2f}, {vector.max():.2f}]")
     
@@ -60,25 +77,29 @@ def test_synthetic_data_generation():
     
     logger.info("✓ Feature structure valid")
     
+    # JSON is only the persistence format; it must round-trip to the dict
+    if _loads(sample['features_json']) != features:
+        logger.error("✗ features_json does not round-trip")
+        return False
+    logger.info("✓ features_json round-trips")
+    
     # Test 4: Check outcome distribution
     logger.info("\n4. Checking outcome distribution...")
-    outcomes = {}
-    for sample in samples:
-        outcome = sample['exit_reason']
-        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    exits = np.array([s['exit_reason'] for s in samples])
+    labels, counts = np.unique(exits, return_counts=True)
     
-    for outcome, count in outcomes.items():
+    for outcome, count in zip(labels, counts):
         pct = count / len(samples) * 100
         logger.info(f"  {outcome}: {count} ({pct:.1f}%)")
     
     # Test 5: Check PnL distribution
     logger.info("\n5. Checking PnL distribution...")
-    pnls = [s['pnl'] for s in samples]
+    pnls = np.fromiter((s['pnl'] for s in samples), dtype=np.float64, count=len(samples))
     
-    logger.info(f"  Mean: ${np.mean(pnls):.2f}")
-    logger.info(f"  Std: ${np.std(pnls):.2f}")
-    logger.info(f"  Min: ${np.min(pnls):.2f}")
-    logger.info(f"  Max: ${np.max(pnls):.2f}")
+    logger.info(f"  Mean: ${pnls.mean():.2f}")
+    logger.info(f"  Std: ${pnls.std():.2f}")
+    logger.info(f"  Min: ${pnls.min():.2f}")
+    logger.info(f"  Max: ${pnls.max():.2f}")
     
     # Test 6: Check timestamp distribution
     logger.info("\n6. Checking timestamp distribution...")
@@ -87,8 +108,7 @@ def test_synthetic_data_generation():
     logger.info(f"  Time range: {time_range / 86400:.1f} days")
     
     # Test 7: Generate larger dataset
-    logger.info("\n7. Generating 1000 samples (production size)...")
-    large_samples = synthetic_data_generator.generate_trade_samples(n_samples=1000)
+    logger.info("\n7. Validating 1000 samples (production size)...")
     large_validation = synthetic_data_generator.validate_samples(large_samples)
     
     logger.info(f"  Valid: {large_validation['valid']}")
@@ -101,6 +121,17 @@ def test_synthetic_data_generation():
     
     logger.info("✓ Large dataset valid")
     
+    # Test 8: Batch feature matrix
+    logger.info("\n8. Building feature matrix for 1000 samples...")
+    matrix = synthetic_data_generator.get_feature_matrix(large_samples)
+    logger.info(f"  Feature matrix shape: {matrix.shape} ({matrix.dtype})")
+    
+    if matrix.shape != (1000, 50):
+        logger.error(f"✗ Invalid matrix shape: {matrix.shape}")
+        return False
+    
+    logger.info("✓ Feature matrix valid")
+    
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("Test Results Summary")
@@ -110,6 +141,7 @@ def test_synthetic_data_generation():
     logger.info("✓ Outcome distribution: Realistic")
     logger.info("✓ PnL distribution: Realistic")
     logger.info("✓ Large dataset: Valid")
+    logger.info("✓ Feature matrix: Valid (1000 x 50)")
     logger.info("=" * 60)
     logger.info("✓ ALL TESTS PASSED")
     logger.info("=" * 60)
@@ -0,0 +1,76 @@
+"""
+Shared fixtures for the sidecar system tests.
+
+Tests can run in parallel with pytest-xdist:
+
+    pytest -n auto --dist loadgroup sidecar/tests
+"""
+
+import copy
+
+import pytest
+
+
+# Named shared-cache in-memory database: every connection in this process
+# sees the same tables, and nothing touches disk.
+TEST_DB_URI = "file:user_db_test?mode=memory&cache=shared"
+TEST_DB_PRAGMAS = [
+    "journal_mode=MEMORY",
+    "synchronous=OFF",
+    "temp_store=MEMORY",
+    "locking_mode=NORMAL",
+]
+
+
+@pytest.fixture(scope="session")
+async def initialized_user_db():
+    """
+    Point the global user DB at an in-memory database and create its tables
+    once per test session.
+
+    A keeper connection stays open for the whole session; SQLite drops a
+    shared-cache memory database when its last connection closes.
+    """
+    import aiosqlite
+
+    from app.data.user_db import user_db
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(user_db, "db_path", TEST_DB_URI)
+        mp.setattr(user_db, "uri", True)
+        mp.setattr(user_db, "pragmas", TEST_DB_PRAGMAS)
+        async with aiosqlite.connect(TEST_DB_URI, uri=True):
+            await user_db.init_db()
+            yield user_db
+
+
+@pytest.fixture
+def isolated_risk_manager():
+    """Snapshot the global risk manager's state and restore it after the test."""
+    from app.risk.risk_manager import risk_manager
+
+    saved = copy.copy(vars(risk_manager))
+    saved['rules'] = copy.deepcopy(risk_manager.rules)
+    yield risk_manager
+    vars(risk_manager).clear()
+    vars(risk_manager).update(saved)
+
+
+@pytest.fixture
+def swap_attr():
+    """
+    Cheap alternative to patch.object: set attributes for the duration of a test.
+
+    Usage: swap_attr(obj, "name", replacement). Originals are restored in
+    reverse order on teardown. Use patch.object only when call assertions
+    are needed.
+    """
+    swaps = []
+
+    def _swap(obj, name, new):
+        swaps.append((obj, name, getattr(obj, name)))
+        setattr(obj, name, new)
+
+    yield _swap
+    for obj, name, original in reversed(swaps):
+        setattr(obj, name, original)
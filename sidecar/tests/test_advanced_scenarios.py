@@ -7,45 +7,42 @@ import pytest
 import pandas as pd
 import numpy as np
 import asyncio
-from unittest.mock import MagicMock, patch, AsyncMock
 from datetime import datetime, time
-import sys
 import os
 
-# Add sidecar to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from app.features.macro_features import macro_features
 from app.data.macro_client import macro_client
 from app.features.quant_features import quant_features
 from app.risk.risk_manager import risk_manager
-from app.data.user_db import user_db, PropRules
+import app.risk.risk_manager as risk_manager_module
 
-from app.ml.transformer_model import transformer_predictor
 # --- 1. Macro Intelligence Edge Cases ---
 
+def _api_down():
+    raise Exception("API Down")
+
 @pytest.mark.asyncio
-async def test_macro_api_total_failure():
+async def test_macro_api_total_failure(swap_attr):
     """Test behavior when ALL macro data sources fail."""
-    with patch.object(macro_client, 'fetch_yield_curve', side_effect=Exception("API Down")), \
-         patch.object(macro_client, 'fetch_inflation_expectations', side_effect=Exception("API Down")):
-        
-        # Should return default/neutral regime, not crash
-        regime = await macro_features.calculate_regime()
-        assert regime['regime'] == "NEUTRAL"
-        assert regime['score'] == 0.0
+    swap_attr(macro_client, 'fetch_yield_curve', _api_down)
+    swap_attr(macro_client, 'fetch_inflation_expectations', _api_down)
+    
+    # Should return default/neutral regime, not crash
+    regime = await macro_features.calculate_regime()
+    assert regime['regime'] == "NEUTRAL"
+    assert regime['score'] == 0.0
 
 @pytest.mark.asyncio
-async def test_macro_extreme_values():
+async def test_macro_extreme_values(swap_attr):
     """Test regime detection with extreme economic data."""
     # Hyperinflation scenario
-    with patch.object(macro_client, 'fetch_yield_curve', return_value={'us10y': 15.0, 'us2y': 10.0, 'spread_10y2y': 5.0}), \
-         patch.object(macro_client, 'fetch_inflation_expectations', return_value={'cpi_yoy': 25.0}):
-        
-        regime = await macro_features.calculate_regime()
-        # High inflation usually triggers specific logic (e.g., STAGFLATION or PANIC)
-        # Assuming logic: High CPI -> Bearish
-        assert regime['score'] == 0.0  # Should be bearish
+    swap_attr(macro_client, 'fetch_yield_curve', lambda: {'us10y': 15.0, 'us2y': 10.0, 'spread_10y2y': 5.0})
+    swap_attr(macro_client, 'fetch_inflation_expectations', lambda: {'cpi_yoy': 25.0})
+    
+    regime = await macro_features.calculate_regime()
+    # High inflation usually triggers specific logic (e.g., STAGFLATION or PANIC)
+    # Assuming logic: High CPI -> Bearish
+    assert regime['score'] == 0.0  # Should be bearish
 
 # --- 2. Deep Quant Edge Cases ---
 
@@ -62,6 +59,20 @@ def test_quant_nan_inf_handling():
     except Exception:
         pytest.fail("Hurst crashed on NaN/Inf input")
 
+def test_quant_nan_inf_batch_sweep():
+    """Fuzz Hurst with many randomly corrupted series in one batched call."""
+    rng = np.random.default_rng(42)
+    data = rng.standard_normal((1000, 256)).cumsum(axis=1)
+    data[rng.random(data.shape) < 0.05] = np.nan
+    data[rng.random(data.shape) < 0.01] = np.inf
+    data[rng.random(data.shape) < 0.01] = -np.inf
+    
+    h = quant_features.calculate_hurst_exponent_batch(data)
+    
+    assert h.shape == (1000,)
+    assert np.all(np.isfinite(h))
+    assert np.all((h >= 0.0) & (h <= 1.0))
+
 def test_quant_insufficient_data():
     """Test FFT/Hurst with too few data points."""
     short_series = pd.Series([1.0, 2.0, 3.0])
@@ -73,7 +84,7 @@ def test_quant_insufficient_data():
 # --- 3. Risk Management Edge Cases ---
 
 @pytest.mark.asyncio
-async def test_risk_boundary_conditions():
+async def test_risk_boundary_conditions(isolated_risk_manager):
     """Test exact boundary conditions for Drawdown."""
     risk_manager.rules = {
         'max_total_loss': 1000.0,
@@ -93,7 +104,7 @@ async def test_risk_boundary_conditions():
     assert allowed_inside is True
 
 @pytest.mark.asyncio
-async def test_risk_timezone_rollover():
+async def test_risk_timezone_rollover(isolated_risk_manager, swap_attr):
     """Test trading hours across midnight (e.g., 22:00 to 02:00)."""
     risk_manager.rules = {
         'trading_hours_start': '22:00',
@@ -101,24 +112,23 @@ async def test_risk_timezone_rollover():
         'timezone': 'UTC'
     }
     
-    # Mock current time to 23:00 (Allowed)
-    with patch('app.risk.risk_manager.datetime') as mock_dt:
-        mock_dt.now.return_value = datetime(2023, 1, 1, 23, 0, 0)
-        mock_dt.strptime = datetime.strptime # Keep original strptime
-        
-        # We need to patch the internal _check_trading_hours logic or the datetime it uses
-        # Since _check_trading_hours uses datetime.now(tz), we need to be careful.
-        # For this test, we'll assume the risk manager handles the "start > end" case correctly.
-        
-        # Let's verify the logic directly if possible, or trust the black box.
-        # If logic is: current >= start OR current <= end (for overnight)
-        pass 
-        # (Skipping complex mock for now, focusing on logic verification)
+    # Mock current time to 23:00 (Allowed); strptime is inherited unchanged
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2023, 1, 1, 23, 0, 0, tzinfo=tz)
+    
+    swap_attr(risk_manager_module, 'datetime', FrozenDatetime)
+    
+    # Overnight window: current >= start OR current <= end
+    assert risk_manager._check_trading_hours() is True
 
 # --- 4. ML Edge Cases ---
 
+@pytest.mark.ml
 def test_transformer_input_mismatch():
     """Test Transformer with incorrect input shape."""
+    pytest.importorskip("torch")
     from app.ml.transformer_model import transformer_predictor
     
     # Expected [Batch, Seq, Dim], passing [Batch, Dim] (Missing Seq)
@@ -132,16 +142,21 @@ def test_transformer_input_mismatch():
 # --- 5. System Resilience ---
 
 @pytest.mark.asyncio
-async def test_concurrent_risk_checks():
+@pytest.mark.parametrize("n_requests", [100])
+async def test_concurrent_risk_checks(n_requests, isolated_risk_manager):
     """Test rapid concurrent risk checks (Race Condition Simulation)."""
     risk_manager.rules = {'max_total_loss': 1000.0}
     
-    # Simulate 100 concurrent trade requests
-    tasks = []
-    for _ in range(100):
-        tasks.append(risk_manager.check_trade_allowed("SYM", 0.1, 100000.0, 100000.0))
+    # Simulate concurrent trade requests, bounded to one in flight per CPU
+    workers = os.cpu_count() or 1
+    sem = asyncio.Semaphore(workers)
+    
+    async def _one():
+        async with sem:
+            return await risk_manager.check_trade_allowed("SYM", 0.1, 100000.0, 100000.0)
     
-    results = await asyncio.gather(*tasks)
+    results = await asyncio.gather(*[_one() for _ in range(n_requests)])
+    assert len(results) == n_requests
     assert all(results) # All should be allowed as state doesn't change in check
     
     # Note: Real race conditions happen when state updates (e.g. adding a position).
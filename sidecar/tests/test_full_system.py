@@ -6,120 +6,157 @@ Tests all VPropTrader upgrades: Macro, Quant, ML, Risk, and User DB.
 import pytest
 import pandas as pd
 import numpy as np
-import torch
-import os
-import sys
 import asyncio
+import logging
 from datetime import datetime
 
-# Add sidecar to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from app.data.macro_client import macro_client
 from app.features.macro_features import macro_features
 from app.features.quant_features import quant_features
 from app.strategies.stat_arb import stat_arb
-from app.ml.transformer_model import transformer_predictor
-from app.ml.rl_agent import rl_agent
 from app.risk.risk_manager import risk_manager
 from app.data.user_db import user_db, PropFirmConfig, PropRules
 
+# Progress output goes through logging; run with --log-cli-level=DEBUG to see it
+logger = logging.getLogger(__name__)
+
 # --- 1. Macro Intelligence Tests ---
 
 def test_macro_client_fallback():
     """Verify Macro Client handles missing API keys gracefully (uses YFinance/Mock)."""
-    print("\n[TEST] Macro Client Fallback")
+    logger.debug("[TEST] Macro Client Fallback")
     data = macro_client.fetch_yield_curve()
     assert 'us10y' in data
     assert 'spread_10y2y' in data
-    print(f"  ✓ Yield Curve Data: {data}")
+    logger.debug(f"  ✓ Yield Curve Data: {data}")
 
 @pytest.mark.asyncio
 async def test_macro_regime_calculation():
     """Verify Macro Regime logic."""
-    print("\n[TEST] Macro Regime Calculation")
+    logger.debug("[TEST] Macro Regime Calculation")
     # Mocking macro_client for deterministic test
     original_fetch = macro_client.fetch_yield_curve
     macro_client.fetch_yield_curve = lambda: {'us10y': 3.5, 'us2y': 4.0, 'spread_10y2y': -0.5} # Inverted
     
     regime = await macro_features.calculate_regime()
     assert regime['regime'] == "RECESSION_WARNING" or regime['regime'] == "PANIC" # Depending on VIX
-    print(f"  ✓ Detected Regime (Inverted Curve): {regime['regime']}")
+    logger.debug(f"  ✓ Detected Regime (Inverted Curve): {regime['regime']}")
     
     # Restore
     macro_client.fetch_yield_curve = original_fetch
 
 # --- 2. Deep Quant Strategy Tests ---
 
-def test_hurst_exponent():
-    """Verify Hurst Exponent distinguishes Trend vs Mean Reversion."""
-    print("\n[TEST] Hurst Exponent")
-    # Mean Reverting (Sine Wave)
+@pytest.fixture(scope="module", autouse=True)
+def seed_rng():
+    """Seed NumPy once per module so generated series are reproducible."""
+    np.random.seed(42)
+
+@pytest.fixture(scope="module")
+def mean_reverting():
+    """Mean Reverting (Sine Wave)."""
     t = np.linspace(0, 100, 1000)
-    mean_rev = pd.Series(np.sin(t))
-    h_mr = quant_features.calculate_hurst_exponent(mean_rev)
-    
-    # Trending (Random Walk with Drift)
-    trend = pd.Series(np.cumsum(np.random.randn(1000) + 0.1))
-    h_trend = quant_features.calculate_hurst_exponent(trend)
+    return pd.Series(np.sin(t))
+
+@pytest.fixture(scope="module")
+def trending(seed_rng):
+    """Trending (Random Walk with Drift)."""
+    return pd.Series(np.cumsum(np.random.randn(1000) + 0.1))
+
+@pytest.fixture(scope="module")
+def cycle_50():
+    """50-period cycle."""
+    t = np.linspace(0, 200, 200)
+    return pd.Series(np.sin(2 * np.pi * t / 50))
+
+@pytest.fixture(scope="module")
+def coint_pairs():
+    """K cointegrated pairs, one per row: y tracks x plus noise."""
+    rng = np.random.default_rng(42)
+    x = np.cumsum(rng.standard_normal((20, 100)), axis=1)
+    y = x + rng.standard_normal((20, 100)) * 0.5
+    return x, y
+
+def test_hurst_exponent(mean_reverting, trending):
+    """Verify Hurst Exponent distinguishes Trend vs Mean Reversion."""
+    logger.debug("[TEST] Hurst Exponent")
+    h_mr = quant_features.calculate_hurst_exponent(mean_reverting)
+    h_trend = quant_features.calculate_hurst_exponent(trending)
     
-    print(f"  ✓ Hurst (Sine Wave): {h_mr:.2f} (Expected < 0.5)")
-    print(f"  ✓ Hurst (Trend): {h_trend:.2f} (Expected > 0.5)")
+    logger.debug(f"  ✓ Hurst (Sine Wave): {h_mr:.2f} (Expected < 0.5)")
+    logger.debug(f"  ✓ Hurst (Trend): {h_trend:.2f} (Expected > 0.5)")
     
     # Note: Simplified Hurst might not be perfect, but should show difference
     assert h_trend > h_mr
 
-def test_fft_cycle():
+def test_fft_cycle(cycle_50):
     """Verify FFT identifies dominant cycle."""
-    print("\n[TEST] FFT Cycle Analysis")
-    # 50-period cycle
-    t = np.linspace(0, 200, 200)
-    cycle = pd.Series(np.sin(2 * np.pi * t / 50)) 
-    period, _ = quant_features.calculate_fft_cycle(cycle)
+    logger.debug("[TEST] FFT Cycle Analysis")
+    period, _ = quant_features.calculate_fft_cycle(cycle_50)
     
-    print(f"  ✓ Detected Period: {period:.2f} (Expected ~50.0)")
+    logger.debug(f"  ✓ Detected Period: {period:.2f} (Expected ~50.0)")
     assert 45 < period < 55
 
-def test_cointegration():
+def test_cointegration(coint_pairs):
     """Verify Cointegration test."""
-    print("\n[TEST] Cointegration (Stat Arb)")
-    np.random.seed(42)
-    x = np.cumsum(np.random.randn(100))
-    y = x + np.random.randn(100) * 0.5 # Cointegrated
+    logger.debug("[TEST] Cointegration (Stat Arb)")
+    x, y = coint_pairs
+    n_coint = 0
+    for i in range(len(x)):
+        is_coint, p_val, _ = stat_arb.check_cointegration(pd.Series(x[i]), pd.Series(y[i]))
+        logger.debug(f"  Pair {i} p-value: {p_val:.4f}")
+        n_coint += bool(is_coint)
     
-    is_coint, p_val, _ = stat_arb.check_cointegration(pd.Series(x), pd.Series(y))
-    print(f"  ✓ Cointegrated Pair p-value: {p_val:.4f}")
-    assert is_coint == True
+    # Any fixed p-value threshold rejects some truly cointegrated pairs,
+    # so require most of them to pass rather than all
+    assert n_coint / len(x) >= 0.9
 
 # --- 3. Next-Gen ML Tests ---
 
-def test_transformer_prediction():
+def _as_input_tensor(torch, tensor):
+    """Contiguous float32 input, pinned when a CUDA device will consume it."""
+    tensor = tensor.contiguous()
+    return tensor.pin_memory() if torch.cuda.is_available() else tensor
+
+@pytest.fixture(scope="module")
+def transformer_dummy():
+    """Batch=1, Seq=20, Dim=10 input, built once per module."""
+    torch = pytest.importorskip("torch")
+    return _as_input_tensor(torch, torch.full((1, 20, 10), 0.5, dtype=torch.float32))
+
+@pytest.fixture(scope="module")
+def rl_state():
+    """State: [PnL, Vol, RSI, MACD, Time]"""
+    torch = pytest.importorskip("torch")
+    return _as_input_tensor(torch, torch.tensor([100.0, 0.02, 70.0, 0.5, 10], dtype=torch.float32))
+
+@pytest.mark.ml
+def test_transformer_prediction(transformer_dummy):
     """Verify Transformer Model forward pass."""
-    print("\n[TEST] Transformer Model")
-    # Batch=1, Seq=20, Dim=10
-    dummy_input = [[0.5]*10]*20 
-    conf = transformer_predictor.predict(dummy_input)
-    print(f"  ✓ Transformer Confidence: {conf:.4f}")
+    from app.ml.transformer_model import transformer_predictor
+    logger.debug("[TEST] Transformer Model")
+    conf = transformer_predictor.predict(transformer_dummy)
+    logger.debug(f"  ✓ Transformer Confidence: {conf:.4f}")
     assert 0.0 <= conf <= 1.0
 
-def test_rl_agent_action():
+@pytest.mark.ml
+def test_rl_agent_action(rl_state):
     """Verify RL Agent selects valid action."""
-    print("\n[TEST] RL Agent")
-    # State: [PnL, Vol, RSI, MACD, Time]
-    state = [100.0, 0.02, 70.0, 0.5, 10]
-    action, probs = rl_agent.select_action(state)
-    print(f"  ✓ RL Action: {action}")
+    from app.ml.rl_agent import rl_agent
+    logger.debug("[TEST] RL Agent")
+    action, probs = rl_agent.select_action(rl_state)
+    logger.debug(f"  ✓ RL Action: {action}")
     assert action in rl_agent.actions
 
 # --- 4. Prop Risk & User DB Tests ---
 
 @pytest.mark.asyncio
-async def test_prop_risk_enforcement():
+@pytest.mark.xdist_group(name="serial")
+async def test_prop_risk_enforcement(initialized_user_db, isolated_risk_manager):
     """Verify Risk Manager blocks trades based on rules."""
-    print("\n[TEST] Prop Risk Engine")
+    logger.debug("[TEST] Prop Risk Engine")
     
-    # 1. Setup DB
-    await user_db.init_db()
+    # 1. Setup DB (initialized_user_db fixture)
     
     # 2. Save Config
     config = PropFirmConfig(firm_name="TestFirm", login="123", password="abc", server="Demo")
@@ -138,13 +175,15 @@ async def test_prop_risk_enforcement():
     
     # 4. Test: Max Total Drawdown Violation
     # Initial Balance 100k, Equity 98k -> Drawdown 2k > 1k Limit
-    allowed = await risk_manager.check_trade_allowed("EURUSD", 1.0, 98000.0, 100000.0)
-    print(f"  ✓ Trade Allowed (Drawdown Violation): {allowed}")
-    assert allowed == False
-    
     # 5. Test: Safe Trade
-    allowed_safe = await risk_manager.check_trade_allowed("EURUSD", 1.0, 100000.0, 100000.0)
-    print(f"  ✓ Trade Allowed (Safe): {allowed_safe}")
+    # Both checks only read the loaded rules, so they can run concurrently.
+    allowed, allowed_safe = await asyncio.gather(
+        risk_manager.check_trade_allowed("EURUSD", 1.0, 98000.0, 100000.0),
+        risk_manager.check_trade_allowed("EURUSD", 1.0, 100000.0, 100000.0),
+    )
+    logger.debug(f"  ✓ Trade Allowed (Drawdown Violation): {allowed}")
+    assert allowed == False
+    logger.debug(f"  ✓ Trade Allowed (Safe): {allowed_safe}")
     # Note: Trading hours check might fail depending on current time. 
     # We mock time check for robustness or accept it might be False if run at night.
     # For this test, we assume running during day or check logs.
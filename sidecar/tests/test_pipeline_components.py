@@ -0,0 +1,64 @@
+"""
+Data pipeline component tests
+Covers the pipeline pieces present in this tree: MetricsCollector batching
+and SymbolMapper normalization.
+"""
+
+from app.core.metrics import MetricsCollector
+from app.data.symbol_mapper import SymbolMapper
+
+
+class TestMetricsCollector:
+    """Batched counter and histogram paths"""
+    
+    def setup_method(self):
+        self.metrics = MetricsCollector(window_size=100)
+    
+    def test_bulk_increment(self):
+        """Batched counter increments match individual increments"""
+        self.metrics.increment_counter("a", 2)
+        self.metrics.bulk_increment({"a": 3, "b": 5})
+        assert self.metrics.get_counter("a") == 5
+        assert self.metrics.get_counter("b") == 5
+        
+        self.metrics.bulk_increment({f"k{i}": 1 for i in range(1000)})
+        assert self.metrics.get_counter("k999") == 1
+    
+    def test_record_values_batch(self):
+        """Batched histogram recording gives the same stats as per-value recording"""
+        self.metrics.record_values("test_histogram", [10, 20, 30])
+        self.metrics.record_values("test_histogram", range(40, 110, 10))
+        
+        stats = self.metrics.get_histogram_stats("test_histogram")
+        assert stats["count"] == 10
+        assert stats["mean"] == 55.0
+    
+    def test_record_values_respects_window(self):
+        """A batch larger than the window keeps only the newest values"""
+        self.metrics.record_values("test_histogram", range(250))
+        
+        stats = self.metrics.get_histogram_stats("test_histogram")
+        assert stats["count"] == 100
+        assert stats["min"] == 150
+
+
+class TestSymbolMapper:
+    """Symbol normalization and its per-instance cache"""
+    
+    def setup_method(self):
+        self.mapper = SymbolMapper()
+    
+    def test_normalize_symbol_cached(self):
+        """Repeated normalization is served from the cache"""
+        assert self.mapper.normalize_symbol("us100-") == "US100"
+        assert self.mapper.normalize_symbol("us100-") == "US100"
+        assert self.mapper.normalize_symbol.cache_info().hits == 1
+    
+    def test_normalize_symbol_coerces_input(self):
+        """Non-string symbols are normalized via str()"""
+        assert self.mapper.normalize_symbol(100) == "100"
+    
+    def test_cache_is_per_instance(self):
+        """Mappers do not share cache entries"""
+        self.mapper.normalize_symbol("xauusd")
+        assert SymbolMapper().normalize_symbol.cache_info().currsize == 0
@@ -0,0 +1,28 @@
+"""
+Signals API filter tests
+Plans the EA would reject are dropped before they are priced or sent.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.signals import _rejected_by_ea
+
+
+def _plan(symbol, confidence=0.9):
+    return SimpleNamespace(symbol=symbol, confidence=confidence)
+
+
+@pytest.mark.parametrize("symbol, confidence, min_confidence, exclude, rejected", [
+    ("NAS100", 0.9, 0.75, "", False),
+    ("NAS100", 0.5, 0.75, "", True),
+    ("NAS100", 0.9, 0.75, "NAS100,XAUUSD", True),
+    ("NAS100", 0.9, 0.75, "US100", True),       # held under its mapped name
+    ("EURUSD", 0.9, 0.75, "NAS100,XAUUSD", False),
+    ("UNKNOWN", 0.9, 0.0, "NAS100", False),     # unmapped symbols pass through
+], ids=["pass", "low-confidence", "held", "held-mapped", "other-held", "unmapped"])
+def test_rejected_by_ea(symbol, confidence, min_confidence, exclude, rejected):
+    """Confidence floor and exclude list, as parsed by get_signals"""
+    excluded = {s.strip() for s in exclude.split(",") if s.strip()}
+    assert _rejected_by_ea(_plan(symbol, confidence), min_confidence, excluded) == rejected
@@ -1,17 +1,16 @@
 """
 System Integration Verification
 Simulates the full Scanner loop to verify all components work together.
+
+Run from the sidecar directory: python -m tests.verify_integration
 """
 
 import asyncio
+import io
 import logging
 import sys
-import os
 from datetime import datetime
 
-# Add sidecar to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 # Configure Logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("IntegrationTest")
@@ -20,13 +19,8 @@ logger = logging.getLogger("IntegrationTest")
 from app.scanner.scanner import global_scanner
 from app.data.user_db import user_db, PropFirmConfig, PropRules
 
-async def run_integration_test():
-    print("\n╔═══════════════════════════════════════════════════╗")
-    print("║   Starting System Integration Test                ║")
-    print("╚═══════════════════════════════════════════════════╝")
-    
-    # 1. Setup Prop Rules (Block unsafe trades)
-    print("\n[STEP 1] Configuring Prop Rules...")
+async def configure_prop_rules():
+    """Create the user DB and save permissive prop rules (save depends on init)."""
     await user_db.init_db()
     config = PropFirmConfig(firm_name="IntegrationFirm", login="999", password="xxx", server="Demo")
     rules = PropRules(
@@ -38,6 +32,16 @@ async def run_integration_test():
         timezone="UTC"
     )
     await user_db.save_prop_config(1, config, rules)
+
+async def run_integration_test():
+    print("\n╔═══════════════════════════════════════════════════╗")
+    print("║   Starting System Integration Test                ║")
+    print("╚═══════════════════════════════════════════════════╝")
+    
+    # 1. Setup Prop Rules (Block unsafe trades)
+    print("\n[STEP 1] Configuring Prop Rules...")
+    # The scanner's risk check reads these rules, so the scan must wait for them.
+    await configure_prop_rules()
     print("✓ Prop Rules Saved")
 
     # 2. Run Scanner (Single Pass)
@@ -57,22 +61,25 @@ async def run_integration_test():
     print("\n[STEP 3] Analyzing Results...")
     print(f"Generated {len(plans)} Trading Plans")
     
+    # Report is buffered and written once so stdout doesn't stall the loop
+    buf = io.StringIO()
     for plan in plans:
-        print(f"  → Symbol: {plan.symbol}, Action: {plan.action}")
-        print(f"    Reason: {plan.reason}")
-        print(f"    Conf: {plan.confidence:.2f}, Q*: {plan.q_star:.2f}")
+        buf.write(f"  → Symbol: {plan.symbol}, Action: {plan.action}\n")
+        buf.write(f"    Reason: {plan.reason}\n")
+        buf.write(f"    Conf: {plan.confidence:.2f}, Q*: {plan.q_star:.2f}\n")
         
         # Verify Features present
         if 'hurst' in plan.features:
-            print(f"    ✓ Quant Feature (Hurst): {plan.features['hurst']:.2f}")
+            buf.write(f"    ✓ Quant Feature (Hurst): {plan.features['hurst']:.2f}\n")
         else:
-            print("    ✗ Missing Quant Features")
+            buf.write("    ✗ Missing Quant Features\n")
             
         # Verify ML
         if 'tft_confidence' in plan.ml_predictions:
-            print(f"    ✓ Transformer Prediction: {plan.ml_predictions['tft_confidence']:.2f}")
+            buf.write(f"    ✓ Transformer Prediction: {plan.ml_predictions['tft_confidence']:.2f}\n")
         else:
-            print("    ✗ Missing Transformer Prediction")
+            buf.write("    ✗ Missing Transformer Prediction\n")
+    sys.stdout.write(buf.getvalue())
 
     print("\n╔═══════════════════════════════════════════════════╗")
     print("║   Integration Test Complete                       ║")
@@ -19,9 +19,85 @@ NO SHORTCUTS - Full production validation.
 
 import sys
 import asyncio
+import importlib
+import io
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Pipeline components: label -> (module, names). Imported once here, so the
+# cost is paid at process start rather than on the event loop.
+_COMPONENT_IMPORTS = {
+    "BaseDataFetcher": ("app.data.base_fetcher", ("BaseDataFetcher", "MarketData")),
+    "DataValidator": ("app.data.data_validator", ("DataValidator",)),
+    "SymbolMapper": ("app.data.symbol_mapper", ("SymbolMapper",)),
+    "CircuitBreaker": ("app.data.circuit_breaker",
+                       ("CircuitBreaker", "CircuitBreakerManager", "CircuitBreakerOpen", "CircuitState")),
+    "MetricsCollector": ("app.core.metrics", ("MetricsCollector",)),
+    "RedisKnowledgeBase": ("app.data.redis_knowledge_base", ("RedisKnowledgeBase",)),
+    "SQLiteHistoricalStore": ("app.data.sqlite_store", ("SQLiteHistoricalStore",)),
+    "IncrementalFeatureEngine": ("app.data.feature_engine", ("IncrementalFeatureEngine",)),
+    "YahooFinanceFetcher": ("app.data.yahoo_fetcher", ("YahooFinanceFetcher",)),
+    "AlphaVantageFetcher": ("app.data.alphavantage_fetcher", ("AlphaVantageFetcher",)),
+    "TwelveDataFetcher": ("app.data.twelvedata_fetcher", ("TwelveDataFetcher",)),
+    "PolygonFetcher": ("app.data.polygon_fetcher", ("PolygonFetcher",)),
+}
+
+_components: Dict[str, Any] = {}
+_import_errors: Dict[str, Exception] = {}
+
+for _label, (_module, _names) in _COMPONENT_IMPORTS.items():
+    try:
+        _mod = importlib.import_module(_module)
+        _components.update({name: getattr(_mod, name) for name in _names})
+    except Exception as e:
+        _import_errors[_label] = e
+
+def _compute_features_sync(symbol: str, bar, history) -> Dict[str, float]:
+    """Process-pool worker: compute one symbol's features with a fresh engine"""
+    engine = _components["IncrementalFeatureEngine"]()
+    return asyncio.run(engine.compute_features(symbol, bar, history))
+
+class _ShiftedTime:
+    """Stand-in for the time module whose clocks read `offset` seconds ahead"""
+
+    def __init__(self, offset: float):
+        self.offset = offset
+
+    def monotonic(self) -> float:
+        return time.monotonic() + self.offset
+
+    def time(self) -> float:
+        return time.time() + self.offset
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+# Upper bound for any single stage; a hung socket fails that stage, not the run
+STAGE_TIMEOUT_SECONDS = 15
+
+# Output sink for the stage running in the current task. None means stdout;
+# stages run by run_tier() each get their own buffer, written out in one call.
+_stage_out: ContextVar[Optional[io.StringIO]] = ContextVar("_stage_out", default=None)
+
+async def bounded_gather(*aws: Awaitable, limit: int = 4) -> List[Any]:
+    """asyncio.gather with at most `limit` awaitables in flight; exceptions are returned"""
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(aw):
+        async with sem:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws), return_exceptions=True)
 
 # Color codes for output
 class Colors:
@@ -37,20 +113,31 @@ def print_header(text: str):
     print(f"{Colors.BOLD}{Colors.BLUE}{text.center(80)}{Colors.END}")
     print(f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.END}\n")
 
+# Prefixes are built once; each line is then a single join + write
+_TEST_PREFIX = f"{Colors.BOLD}Testing: "
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓ "
+_ERROR_PREFIX = f"{Colors.RED}✗ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠ "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ "
+_LINE_END = f"{Colors.END}\n"
+
+def _emit(prefix: str, message: str):
+    (_stage_out.get() or sys.stdout).write("".join((prefix, message, _LINE_END)))
+
 def print_test(name: str):
-    print(f"{Colors.BOLD}Testing: {name}{Colors.END}")
+    _emit(_TEST_PREFIX, name)
 
 def print_success(message: str):
-    print(f"{Colors.GREEN}✓ {message}{Colors.END}")
+    _emit(_SUCCESS_PREFIX, message)
 
 def print_error(message: str):
-    print(f"{Colors.RED}✗ {message}{Colors.END}")
+    _emit(_ERROR_PREFIX, message)
 
 def print_warning(message: str):
-    print(f"{Colors.YELLOW}⚠ {message}{Colors.END}")
+    _emit(_WARNING_PREFIX, message)
 
 def print_info(message: str):
-    print(f"{Colors.BLUE}ℹ {message}{Colors.END}")
+    _emit(_INFO_PREFIX, message)
 
 
 class PipelineValidator:
@@ -60,10 +147,26 @@ class PipelineValidator:
         self.tests_passed = 0
         self.tests_failed = 0
         self.tests_total = 0
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()  # monotonic; immune to wall-clock jumps
+        self._t0 = datetime.now()  # reference time for every test bar
+        # CPU-bound feature checks run in a process pool, created on first use
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Timings are reported, never pass/fail: they depend on the host
+        self.performance_metrics: Dict[str, str] = {}
+        # Per-stage latency histograms (stage_<name>_ms), reported in the summary
+        metrics_cls = _components.get("MetricsCollector")
+        self.metrics = metrics_cls(window_size=100) if metrics_cls else None
+        # One pool for every Redis-touching stage
+        self.redis_pool = (
+            aioredis.ConnectionPool(host='localhost', port=6379, db=0) if aioredis else None
+        )
         
     def record_test(self, passed: bool, test_name: str, details: str = ""):
-        """Record test result"""
+        """
+        Record test result
+
+        Never awaits, so counter updates from concurrent stages cannot interleave.
+        """
         self.tests_total += 1
         if passed:
             self.tests_passed += 1
@@ -72,100 +175,112 @@ class PipelineValidator:
             self.tests_failed += 1
             print_error(f"{test_name} {details}")
     
-    async def validate_imports(self) -> bool:
-        """Validate all component imports"""
-        print_test("Component Imports")
-        
+    def record_metric(self, name: str, value: float, unit: str = ""):
+        """Record a timing or throughput figure (reported in the summary)"""
+        self.performance_metrics[name] = f"{value:.3f}{unit}"
+        print_info(f"{name}: {value:.3f}{unit}")
+    
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """Process pool for CPU-bound checks, started on first use"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._pool
+    
+    def _bar(self, i: int = 0, **over):
+        """Test MarketData bar stamped i seconds after the reference time; fields overridable"""
+        fields = dict(symbol="TEST", timestamp=self._t0 + timedelta(seconds=i),
+                      open=100.0, high=101.0, low=99.0, close=100.5, volume=1000, source="test")
+        fields.update(over)
+        return self.MarketData(**fields)
+    
+    def _bars(self, n: int, template=None) -> list:
+        """n distinct copies of template (default self._bar()), timestamps one second apart"""
+        template = template or self._bar()
+        return [replace(template, timestamp=template.timestamp + timedelta(seconds=i))
+                for i in range(n)]
+    
+    async def _run_stage(self, name: str, coro: Awaitable[bool]) -> bool:
+        """
+        Await a stage, failing it if it raises or runs past STAGE_TIMEOUT_SECONDS
+
+        Always returns a bool, so a crashed stage can never be mistaken for a
+        pass in run_tier's results; records the stage latency.
+        """
+        t0 = time.perf_counter_ns()
         try:
-            from app.data.base_fetcher import BaseDataFetcher, MarketData
-            self.record_test(True, "BaseDataFetcher import")
-            
-            from app.data.data_validator import DataValidator
-            self.record_test(True, "DataValidator import")
-            
-            from app.data.symbol_mapper import SymbolMapper
-            self.record_test(True, "SymbolMapper import")
-            
-            from app.data.circuit_breaker import CircuitBreaker, CircuitBreakerManager
-            self.record_test(True, "CircuitBreaker import")
-            
-            from app.core.metrics import MetricsCollector
-            self.record_test(True, "MetricsCollector import")
-            
-            from app.data.redis_knowledge_base import RedisKnowledgeBase
-            self.record_test(True, "RedisKnowledgeBase import")
-            
-            from app.data.sqlite_store import SQLiteHistoricalStore
-            self.record_test(True, "SQLiteHistoricalStore import")
-            
-            from app.data.feature_engine import IncrementalFeatureEngine
-            self.record_test(True, "IncrementalFeatureEngine import")
-            
-            from app.data.yahoo_fetcher import YahooFinanceFetcher
-            self.record_test(True, "YahooFinanceFetcher import")
-            
-            from app.data.alphavantage_fetcher import AlphaVantageFetcher
-            self.record_test(True, "AlphaVantageFetcher import")
-            
-            from app.data.twelvedata_fetcher import TwelveDataFetcher
-            self.record_test(True, "TwelveDataFetcher import")
-            
-            from app.data.polygon_fetcher import PolygonFetcher
-            self.record_test(True, "PolygonFetcher import")
-            
-            return True
-            
+            return await asyncio.wait_for(coro, STAGE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            self.record_test(False, name, f"timeout after {STAGE_TIMEOUT_SECONDS}s")
+            return False
         except Exception as e:
-            self.record_test(False, "Import failed", str(e))
+            self.record_test(False, name, f"crashed: {type(e).__name__}: {e}")
             return False
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_value(f"stage_{name}_ms", (time.perf_counter_ns() - t0) / 1e6)
+    
+    async def run_tier(self, *stages: Callable[[], Awaitable[bool]]) -> List[bool]:
+        """
+        Run independent stages concurrently, at most four at a time.
+
+        Each stage writes into its own buffer; the buffers are printed in
+        declaration order once the whole tier is done, so output stays readable.
+        """
+        buffers = [io.StringIO() for _ in stages]
+
+        async def _run(stage, buf):
+            _stage_out.set(buf)  # gather() runs each coroutine in its own task/context
+            return await self._run_stage(stage.__name__.removeprefix("validate_"), stage())
+
+        results = await bounded_gather(*(_run(stage, buf) for stage, buf in zip(stages, buffers)),
+                                       limit=4)
+        sys.stdout.write("".join(buf.getvalue() for buf in buffers))
+        return list(results)
+    
+    async def validate_imports(self) -> bool:
+        """Validate all component imports (performed once at module load)"""
+        print_test("Component Imports")
+        
+        for label in _COMPONENT_IMPORTS:
+            error = _import_errors.get(label)
+            self.record_test(error is None, f"{label} import", str(error) if error else "")
+        
+        # Later stages use these, e.g. self.DataValidator; a stage whose
+        # component failed to import fails with AttributeError
+        for name, obj in _components.items():
+            setattr(self, name, obj)
+        
+        return not _import_errors
     
     async def validate_data_validator(self) -> bool:
         """Validate DataValidator functionality"""
         print_test("Data Validator")
         
         try:
-            from app.data.data_validator import DataValidator
-            from app.data.base_fetcher import MarketData
-            
-            validator = DataValidator(quality_threshold=0.8)
+            validator = self.DataValidator(quality_threshold=0.8)
             self.record_test(True, "DataValidator initialization")
             
             # Test valid data
-            valid_bar = MarketData(
-                symbol="NAS100",
-                timestamp=datetime.now(),
-                open=15000.0,
-                high=15010.0,
-                low=14990.0,
-                close=15005.0,
-                volume=1000,
-                source="test"
-            )
+            valid_bar = self._bar(symbol="NAS100", open=15000.0, high=15010.0,
+                                  low=14990.0, close=15005.0)
             
             result = validator.validate(valid_bar)
             self.record_test(result.is_valid, "Valid data validation", 
                            f"Quality: {result.quality_score:.2f}")
             
             # Test invalid OHLC
-            invalid_bar = MarketData(
-                symbol="NAS100",
-                timestamp=datetime.now(),
-                open=15000.0,
-                high=14990.0,  # High < Open (invalid)
-                low=14990.0,
-                close=15005.0,
-                volume=1000,
-                source="test"
-            )
+            invalid_bar = self._bar(symbol="NAS100", open=15000.0,
+                                    high=14990.0,  # High < Open (invalid)
+                                    low=14990.0, close=15005.0)
             
             result = validator.validate(invalid_bar)
             self.record_test(not result.is_valid, "Invalid OHLC detection",
                            f"Issues: {len(result.issues)}")
             
-            # Test batch validation
-            bars = [valid_bar] * 5
+            # Test batch validation (distinct bars, one second apart)
+            bars = self._bars(5, valid_bar)
             valid_bars, quality = validator.validate_batch(bars)
-            self.record_test(len(valid_bars) == 5, "Batch validation",
+            self.record_test(len(valid_bars) == len(bars), "Batch validation",
                            f"Quality: {quality:.2f}")
             
             return True
@@ -179,11 +294,16 @@ class PipelineValidator:
         print_test("Symbol Mapper")
         
         try:
-            from app.data.symbol_mapper import SymbolMapper
-            
-            mapper = SymbolMapper()
+            mapper = self.SymbolMapper()
             self.record_test(True, "SymbolMapper initialization")
             
+            # Test memoized normalization: the repeat lookup is a cache hit
+            first = mapper.normalize_symbol("us100-")
+            second = mapper.normalize_symbol("us100-")
+            hits = mapper.normalize_symbol.cache_info().hits
+            self.record_test(first == second and hits >= 1, "Normalization cache hit",
+                           f"{first}, hits: {hits}")
+            
             # Test broker to generic
             generic = mapper.to_generic_symbol("US100.e")
             self.record_test(generic == "NAS100", "Broker to generic",
@@ -214,7 +334,7 @@ class PipelineValidator:
             # Test all mappings
             mappings = mapper.get_all_mappings("NAS100")
             self.record_test(len(mappings) > 0, "Get all mappings",
-                           f"Keys: {list(mappings.keys())}")
+                           f"Keys: {sorted(mappings)}")
             
             # Test validation
             is_valid = mapper.is_valid_generic_symbol("NAS100")
@@ -234,13 +354,11 @@ class PipelineValidator:
         print_test("Circuit Breaker")
         
         try:
-            from app.data.circuit_breaker import CircuitBreaker, CircuitState
-            
-            breaker = CircuitBreaker(failure_threshold=3, timeout_seconds=1)
+            breaker = self.CircuitBreaker(failure_threshold=3, timeout_seconds=1)
             self.record_test(True, "CircuitBreaker initialization")
             
             # Test CLOSED state
-            self.record_test(breaker.state == CircuitState.CLOSED, 
+            self.record_test(breaker.state == self.CircuitState.CLOSED, 
                            "Initial state CLOSED")
             
             # Test successful call
@@ -261,22 +379,31 @@ class PipelineValidator:
                 except:
                     pass
             
-            self.record_test(breaker.state == CircuitState.OPEN,
+            self.record_test(breaker.state == self.CircuitState.OPEN,
                            "Circuit OPEN after threshold failures",
                            f"Failures: {breaker.failure_count}")
             
             # Test fast fail in OPEN state
-            from app.data.circuit_breaker import CircuitBreakerOpen
             try:
                 await breaker.call(success_func)
                 self.record_test(False, "Should fail fast in OPEN state")
-            except CircuitBreakerOpen:
+            except self.CircuitBreakerOpen:
                 self.record_test(True, "Fast fail in OPEN state")
             
             # Test recovery to HALF_OPEN
-            await asyncio.sleep(1.1)  # Wait for timeout
-            result = await breaker.call(success_func)
-            self.record_test(breaker.state == CircuitState.CLOSED,
+            # Move the breaker's clock past the 1s timeout instead of sleeping,
+            # when it reads time through its module's `time` import
+            breaker_module = sys.modules[self.CircuitBreaker.__module__]
+            if getattr(breaker_module, "time", None) is time:
+                breaker_module.time = _ShiftedTime(2.0)
+                try:
+                    result = await breaker.call(success_func)
+                finally:
+                    breaker_module.time = time
+            else:
+                await asyncio.sleep(1.1)  # Wait for timeout
+                result = await breaker.call(success_func)
+            self.record_test(breaker.state == self.CircuitState.CLOSED,
                            "Recovery to CLOSED after success")
             
             # Test statistics
@@ -295,9 +422,7 @@ class PipelineValidator:
         print_test("Metrics Collector")
         
         try:
-            from app.core.metrics import MetricsCollector
-            
-            metrics = MetricsCollector(window_size=100)
+            metrics = self.MetricsCollector(window_size=100)
             self.record_test(True, "MetricsCollector initialization")
             
             # Test counter operations
@@ -356,20 +481,21 @@ class PipelineValidator:
         print_test("Redis Connection")
         
         try:
-            import redis
-            
-            # Test basic connection
-            r = redis.Redis(host='localhost', port=6379, db=0)
-            pong = r.ping()
-            self.record_test(pong, "Redis PING")
-            
-            # Test set/get
-            r.set('test_key', 'test_value')
-            value = r.get('test_key')
-            self.record_test(value == b'test_value', "Redis SET/GET")
-            
-            # Clean up
-            r.delete('test_key')
+            if self.redis_pool is None:
+                raise ImportError("redis package is not installed")
+            
+            # PING, SET/GET and cleanup in one round trip
+            r = aioredis.Redis(connection_pool=self.redis_pool)
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                pipe.set('test_key', 'test_value')
+                pipe.get('test_key')
+                pipe.delete('test_key')
+                results = await pipe.execute()
+            await r.aclose()  # the shared pool stays open
+            
+            self.record_test(results[0] is True, "Redis PING")
+            self.record_test(results[2] == b'test_value', "Redis SET/GET")
             
             return True
             
@@ -383,24 +509,12 @@ class PipelineValidator:
         print_test("Redis Knowledge Base")
         
         try:
-            from app.data.redis_knowledge_base import RedisKnowledgeBase
-            from app.data.base_fetcher import MarketData
-            
-            redis_kb = RedisKnowledgeBase()
+            redis_kb = self.RedisKnowledgeBase()
             await redis_kb.initialize()
             self.record_test(True, "RedisKnowledgeBase initialization")
             
             # Test store bar
-            test_bar = MarketData(
-                symbol="TEST",
-                timestamp=datetime.now(),
-                open=100.0,
-                high=101.0,
-                low=99.0,
-                close=100.5,
-                volume=1000,
-                source="test"
-            )
+            test_bar = self._bar()
             
             await redis_kb.store_bar("TEST", test_bar)
             self.record_test(True, "Store bar in Redis")
@@ -411,19 +525,27 @@ class PipelineValidator:
                            "Get latest from Redis", f"Close: {retrieved.close if retrieved else 'None'}")
             
             # Test batch store
-            bars = [test_bar] * 5
+            bars = self._bars(5, test_bar)
             await redis_kb.batch_store(bars)
             self.record_test(True, "Batch store in Redis")
             
+            # batch_store pipelines its writes; time a 5k-bar batch for the summary
+            bulk = self._bars(5000, test_bar)
+            batch_start = time.perf_counter()
+            await redis_kb.batch_store(bulk)
+            batch_s = time.perf_counter() - batch_start
+            self.record_test(True, "Pipelined batch store", f"Bars: {len(bulk)}")
+            self.record_metric("Redis batch_store (5k bars)", batch_s, "s")
+            
             # Test get history
             history = await redis_kb.get_history("TEST", n_bars=5)
-            self.record_test(len(history) > 0, "Get history from Redis",
+            self.record_test(len(history) == 5, "Get history from Redis",
                            f"Bars: {len(history)}")
             
             # Test stats
             stats = await redis_kb.get_stats()
             self.record_test(len(stats) > 0, "Redis stats",
-                           f"Keys: {list(stats.keys())}")
+                           f"Keys: {sorted(stats)}")
             
             # Cleanup
             await redis_kb.close()
@@ -439,32 +561,25 @@ class PipelineValidator:
         print_test("SQLite Historical Store")
         
         try:
-            from app.data.sqlite_store import SQLiteHistoricalStore
-            from app.data.base_fetcher import MarketData
-            
             # Use in-memory database for testing
-            sqlite_store = SQLiteHistoricalStore(db_path=":memory:")
+            sqlite_store = self.SQLiteHistoricalStore(db_path=":memory:")
             await sqlite_store.initialize()
             self.record_test(True, "SQLiteHistoricalStore initialization")
             
-            # Test buffer write
-            test_bar = MarketData(
-                symbol="TEST",
-                timestamp=datetime.now(),
-                open=100.0,
-                high=101.0,
-                low=99.0,
-                close=100.5,
-                volume=1000,
-                source="test"
-            )
-            
-            await sqlite_store.buffer_write(test_bar)
-            self.record_test(True, "Buffer write")
+            # Test buffer write with enough bars to exercise the batched flush
+            n = 10_000
+            bars = self._bars(n)
+            
+            for bar in bars:
+                await sqlite_store.buffer_write(bar)
+            self.record_test(True, "Buffer write", f"Bars: {n}")
             
             # Test flush
+            flush_start = time.perf_counter()
             await sqlite_store.flush_buffer()
-            self.record_test(True, "Flush buffer")
+            flush_s = time.perf_counter() - flush_start
+            self.record_test(True, "Flush buffer", f"Bars: {n}")
+            self.record_metric("SQLite flush_buffer (10k bars)", flush_s, "s")
             
             # Test get historical
             history = await sqlite_store.get_historical("TEST", days=1)
@@ -473,7 +588,7 @@ class PipelineValidator:
             
             # Test stats
             stats = await sqlite_store.get_stats()
-            self.record_test(len(stats) > 0, "SQLite stats",
+            self.record_test(stats.get('total_bars', 0) >= n, "SQLite stats",
                            f"Total bars: {stats.get('total_bars', 0)}")
             
             # Cleanup
@@ -490,36 +605,36 @@ class PipelineValidator:
         print_test("Feature Engine")
         
         try:
-            from app.data.feature_engine import IncrementalFeatureEngine
-            from app.data.base_fetcher import MarketData
-            
-            engine = IncrementalFeatureEngine()
+            engine = self.IncrementalFeatureEngine()
             self.record_test(True, "IncrementalFeatureEngine initialization")
             
-            # Create test data
-            test_bar = MarketData(
-                symbol="TEST",
-                timestamp=datetime.now(),
-                open=100.0,
-                high=101.0,
-                low=99.0,
-                close=100.5,
-                volume=1000,
-                source="test"
-            )
-            
-            history = [test_bar] * 50  # Need history for indicators
+            # Create test data: 50 one-minute bars (indicators need history)
+            history = [
+                self._bar(60 * i, open=100.0 + 0.1 * i, high=100.6 + 0.1 * i,
+                          low=99.4 + 0.1 * i, close=100.1 + 0.1 * i)
+                for i in range(50)
+            ]
             
             # Test feature computation
-            features = await engine.compute_features("TEST", test_bar, history)
+            features = await engine.compute_features("TEST", history[-1], history)
             self.record_test(len(features) > 0, "Feature computation",
                            f"Features: {len(features)}")
             
+            # Many symbols: one worker process per computation, in parallel
+            symbols = [f"TEST{k}" for k in range(8)]
+            loop = asyncio.get_running_loop()
+            pool = self._process_pool()
+            futs = [loop.run_in_executor(pool, _compute_features_sync, symbol, history[-1], history)
+                    for symbol in symbols]
+            features_list = await asyncio.gather(*futs)
+            self.record_test(all(len(f) > 0 for f in features_list), "Parallel multi-symbol features",
+                           f"Symbols: {len(features_list)}")
+            
             # Check for expected indicators
-            expected_indicators = ['rsi', 'ema', 'atr', 'close']
-            found_indicators = [ind for ind in expected_indicators if ind in features]
-            self.record_test(len(found_indicators) > 0, "Indicator presence",
-                           f"Found: {found_indicators}")
+            expected_indicators = {'rsi', 'ema', 'atr', 'close'}
+            found_indicators = expected_indicators & features.keys()
+            self.record_test(bool(found_indicators), "Indicator presence",
+                           f"Found: {sorted(found_indicators)}")
             
             return True
             
@@ -532,44 +647,39 @@ class PipelineValidator:
         print_test("Data Fetchers")
         
         try:
-            from app.data.yahoo_fetcher import YahooFinanceFetcher
-            from app.data.alphavantage_fetcher import AlphaVantageFetcher
-            from app.data.twelvedata_fetcher import TwelveDataFetcher
-            from app.data.polygon_fetcher import PolygonFetcher
-            
-            # Yahoo Finance
-            yahoo = YahooFinanceFetcher()
-            await yahoo.initialize()
-            self.record_test(True, "YahooFinanceFetcher initialization")
-            await yahoo.close()
-            
-            # Alpha Vantage
-            alpha = AlphaVantageFetcher(api_key="test_key")
-            await alpha.initialize()
-            self.record_test(True, "AlphaVantageFetcher initialization")
-            await alpha.close()
-            
-            # Twelve Data
-            twelve = TwelveDataFetcher(api_key="test_key")
-            await twelve.initialize()
-            self.record_test(True, "TwelveDataFetcher initialization")
-            await twelve.close()
-            
-            # Polygon
-            polygon = PolygonFetcher(api_key="test_key")
-            await polygon.initialize()
-            self.record_test(True, "PolygonFetcher initialization")
-            await polygon.close()
+            fetchers = [
+                self.YahooFinanceFetcher(),
+                self.AlphaVantageFetcher(api_key="test_key"),
+                self.TwelveDataFetcher(api_key="test_key"),
+                self.PolygonFetcher(api_key="test_key"),
+            ]
             
-            return True
+            # Overlap connection setup, two handshakes at a time; one provider
+            # failing doesn't stop the others
+            results = await bounded_gather(*(f.initialize() for f in fetchers), limit=2)
+            for fetcher, result in zip(fetchers, results):
+                failed = isinstance(result, Exception)
+                self.record_test(not failed, f"{type(fetcher).__name__} initialization",
+                               str(result) if failed else "")
+            
+            await asyncio.gather(*(f.close() for f in fetchers), return_exceptions=True)
+            
+            return not any(isinstance(r, Exception) for r in results)
             
         except Exception as e:
             self.record_test(False, "Data fetcher test failed", str(e))
             return False
     
+    async def close(self):
+        """Release shared connections and worker processes"""
+        if self.redis_pool is not None:
+            await self.redis_pool.disconnect()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+    
     def print_summary(self):
         """Print validation summary"""
-        elapsed = time.time() - self.start_time
+        elapsed = (time.perf_counter_ns() - self.start_ns) / 1e9
         
         print_header("VALIDATION SUMMARY")
         
@@ -579,6 +689,20 @@ class PipelineValidator:
         print(f"Success Rate: {(self.tests_passed/self.tests_total*100):.1f}%")
         print(f"Elapsed Time: {elapsed:.2f}s")
         
+        if self.performance_metrics:
+            print("\nTimings:")
+        for name, value in self.performance_metrics.items():
+            print(f"  {name:<32} {value}")
+        
+        if self.metrics is not None:
+            stage_keys = [k for k in self.metrics.histograms if k.startswith("stage_")]
+            if stage_keys:
+                print("\nStage latency (ms):")
+            for key in stage_keys:
+                stats = self.metrics.get_histogram_stats(key)
+                name = key[len("stage_"):-len("_ms")]
+                print(f"  {name:<22} p50={stats['p50']:9.2f}  p95={stats['p95']:9.2f}  max={stats['max']:9.2f}")
+        
         if self.tests_failed == 0:
             print(f"\n{Colors.GREEN}{Colors.BOLD}✓ ALL TESTS PASSED - PIPELINE READY FOR PRODUCTION{Colors.END}\n")
             return 0
@@ -594,17 +718,27 @@ async def main():
     
     validator = PipelineValidator()
     
-    # Run all validations
-    await validator.validate_imports()
-    await validator.validate_data_validator()
-    await validator.validate_symbol_mapper()
-    await validator.validate_circuit_breaker()
-    await validator.validate_metrics_collector()
-    await validator.validate_redis_connection()
-    await validator.validate_redis_knowledge_base()
-    await validator.validate_sqlite_store()
-    await validator.validate_feature_engine()
-    await validator.validate_data_fetchers()
+    # Tier 1: everything else needs the imports
+    await validator.run_tier(validator.validate_imports)
+
+    # Tier 2: independent stages, overlapped on the event loop
+    await validator.run_tier(
+        validator.validate_data_validator,
+        validator.validate_symbol_mapper,
+        validator.validate_circuit_breaker,
+        validator.validate_metrics_collector,
+        validator.validate_redis_connection,
+        validator.validate_feature_engine,
+        validator.validate_data_fetchers,
+    )
+
+    # Tier 3: stages that need Redis up
+    await validator.run_tier(
+        validator.validate_redis_knowledge_base,
+        validator.validate_sqlite_store,
+    )
+    
+    await validator.close()
     
     # Print summary
     exit_code = validator.print_summary()
@@ -18,14 +18,134 @@ COMPREHENSIVE SYSTEM VALIDATION - NO COMPONENT LEFT UNTESTED
 import sys
 import os
 import asyncio
+import contextvars
+import importlib
+import mmap
 import time
-import json
+from array import array
+from collections import defaultdict
 from datetime import datetime
-from pathlib import Path
+from timeit import Timer
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 # Add sidecar to path
 sys.path.append('sidecar')
 
+# Timestamp for test bars; the value is irrelevant to the checks
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
+# (output lines, pending results) of the phase running in the current
+# task/thread; None outside run_phases(), where results apply immediately
+_phase = contextvars.ContextVar("_phase", default=None)
+
+def _ci(module, name, _sm=sys.modules, _im=importlib.import_module):
+    """cached_import: take the module from sys.modules when already loaded"""
+    m = _sm.get(module) or _im(module)
+    return getattr(m, name)
+
+def _write(text):
+    """Append text to the current phase's line buffer, or write it to stdout"""
+    phase = _phase.get()
+    if phase is not None:
+        phase[0].append(text)
+    else:
+        sys.stdout.write(text)
+
+# (label, ((module, class), ...)) import groups checked by the sidecar phase
+_SIDECAR_IMPORTS = (
+    ('Orchestrator import', (
+        ('app.data.high_frequency_orchestrator', 'HighFrequencyDataOrchestrator'),
+    )),
+    ('Data fetchers import', (
+        ('app.data.yahoo_fetcher', 'YahooFinanceFetcher'),
+        ('app.data.alphavantage_fetcher', 'AlphaVantageFetcher'),
+        ('app.data.twelvedata_fetcher', 'TwelveDataFetcher'),
+        ('app.data.polygon_fetcher', 'PolygonFetcher'),
+    )),
+    ('Storage components import', (
+        ('app.data.redis_knowledge_base', 'RedisKnowledgeBase'),
+        ('app.data.sqlite_store', 'SQLiteHistoricalStore'),
+    )),
+    ('Processing components import', (
+        ('app.data.feature_engine', 'IncrementalFeatureEngine'),
+        ('app.data.circuit_breaker', 'CircuitBreaker'),
+        ('app.data.symbol_mapper', 'SymbolMapper'),
+    )),
+    ('ML models import', (
+        ('app.ml.lstm_model', 'LSTMModel'),
+        ('app.ml.random_forest', 'RandomForestModel'),
+        ('app.ml.gbt_meta_learner', 'GBTMetaLearner'),
+    )),
+    ('Trading components import', (
+        ('app.scanner.scanner', 'GlobalScanner'),
+        ('app.risk.position_sizing', 'PositionSizer'),
+    )),
+)
+
+def _import_group(names):
+    """Import one group's classes, returning {class name: class}"""
+    return {name: getattr(importlib.import_module(module), name) for module, name in names}
+
+# Paths checked by the phases; constants, so built once at import
+_REQUIRED_DIRS = ('sidecar', 'dashboard', 'mt5_ea', 'scripts', 'deploy', 'tests', 'data', 'logs', 'models')
+
+_KEY_FILES = (
+    'sidecar/app/main.py',
+    'sidecar/app/data/high_frequency_orchestrator.py',
+    'mt5_ea/QuantSupraAI.mq5',
+    'dashboard/package.json',
+    'ecosystem.config.js',
+    'README.md',
+    'vproptraderPRD.txt',
+)
+
+_MQL_FILES = (
+    'mt5_ea/QuantSupraAI.mq5',
+    'mt5_ea/Include/TradeEngine.mqh',
+    'mt5_ea/Include/RiskManager.mqh',
+    'mt5_ea/Include/RestClient.mqh',
+    'mt5_ea/Include/Governors.mqh',
+    'mt5_ea/Include/Structures.mqh',
+    'mt5_ea/config.mqh',
+)
+
+_REACT_FILES = (
+    'dashboard/src/app/page.tsx',
+    'dashboard/src/app/layout.tsx',
+    'dashboard/src/app/trades/page.tsx',
+    'dashboard/src/app/performance/page.tsx',
+    'dashboard/src/components/Navigation.tsx',
+)
+_DASHBOARD_FILES = ('dashboard/package.json',) + _REACT_FILES
+
+_ENV_FILES = (
+    'sidecar/.env',
+    'sidecar/.env.example',
+    'dashboard/.env.local',
+    'dashboard/.env.example',
+)
+_CONFIG_FILES = _ENV_FILES + ('ecosystem.config.js',)
+
+_DEPLOY_SCRIPTS = (
+    'scripts/setup_and_start.sh',
+    'scripts/monitor.sh',
+    'scripts/go_live.sh',
+    'deploy/deploy_sidecar.sh',
+    'deploy/deploy_dashboard.sh',
+)
+
+_KEY_DOCS = (
+    'README.md',
+    'SETUP_GUIDE.md',
+    'DEPLOYMENT_GUIDE.md',
+    'FINAL_TEST_REPORT.md',
+    'COMPLETE_SYSTEM_ANALYSIS.md',
+)
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -36,13 +156,48 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+def _count_files_fast(root, threshold=201):
+    """
+    Count regular files under root, stopping once threshold is reached.
+
+    Iterative os.scandir walk; DirEntry type checks reuse the directory
+    listing instead of issuing a stat() per entry.
+    """
+    count = 0
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        count += 1
+                        if count >= threshold:
+                            return count
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return count
+
+# Built once; record_test runs for every check
+_GREEN_CHECK = '\033[92m✓ '
+_RED_CROSS = '\033[91m✗ '
+_END = '\033[0m'
+
 class SystemTester:
     def __init__(self):
         self.tests_passed = 0
         self.tests_failed = 0
         self.tests_total = 0
         self.start_time = time.time()
-        self.results = {}
+        # Per category: counts plus parallel columns of test names, pass flags and details
+        self.results = defaultdict(
+            lambda: {'passed': 0, 'failed': 0, 'names': [], 'flags': array('B'), 'details': []}
+        )
+        self._md_count = None
+        self._mods = None       # shared sidecar classes, see _ensure_sidecar_loaded()
+        self._test_bar = None
         
     def print_header(self, text):
         print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*100}{Colors.END}")
@@ -50,197 +205,246 @@ class SystemTester:
         print(f"{Colors.BOLD}{Colors.BLUE}{'='*100}{Colors.END}\n")
     
     def print_section(self, text):
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'─'*80}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'─'*80}{Colors.END}")
+        rule = f"{Colors.BOLD}{Colors.CYAN}{'─'*80}{Colors.END}\n"
+        _write(f"\n{rule}{Colors.BOLD}{Colors.CYAN}{text}{Colors.END}\n{rule}")
     
     def record_test(self, category, test_name, passed, details=""):
+        phase = _phase.get()
+        if phase is not None:
+            # Concurrent phase: keep the result local, tallied after gather
+            phase[1].append((category, test_name, passed, details))
+        else:
+            self._tally(category, test_name, passed, details)
+        
+        _write(f"{_GREEN_CHECK if passed else _RED_CROSS}{test_name} {details}{_END}\n")
+    
+    def _tally(self, category, test_name, passed, details):
         self.tests_total += 1
-        if category not in self.results:
-            self.results[category] = {'passed': 0, 'failed': 0, 'tests': []}
+        results = self.results[category]
         
         if passed:
             self.tests_passed += 1
-            self.results[category]['passed'] += 1
-            print(f"{Colors.GREEN}✓ {test_name} {details}{Colors.END}")
+            results['passed'] += 1
         else:
             self.tests_failed += 1
-            self.results[category]['failed'] += 1
-            print(f"{Colors.RED}✗ {test_name} {details}{Colors.END}")
-        
-        self.results[category]['tests'].append({
-            'name': test_name,
-            'passed': passed,
-            'details': details
-        })
+            results['failed'] += 1
+        
+        results['names'].append(test_name)
+        results['flags'].append(bool(passed))
+        results['details'].append(details)
+    
+    # Sidecar classes shared by the sidecar, pipeline and performance phases
+    _SIDECAR_MODS = {
+        'DataValidator': 'app.data.data_validator',
+        'MarketData': 'app.data.base_fetcher',
+        'SymbolMapper': 'app.data.symbol_mapper',
+        'IncrementalFeatureEngine': 'app.data.feature_engine',
+    }
+    
+    def _ensure_sidecar_loaded(self):
+        """Put sidecar on sys.path and load the shared classes and test bar, once"""
+        if self._mods is not None:
+            return
+        sidecar_path = os.path.join(os.getcwd(), 'sidecar')
+        if sidecar_path not in sys.path:
+            sys.path.insert(0, sidecar_path)
+        
+        self._mods = {}
+        for name, module in self._SIDECAR_MODS.items():
+            try:
+                self._mods[name] = _ci(module, name)
+            except Exception as e:
+                self._mods[name] = e  # re-raised by _mod() in the phase that needs it
+        
+        if not isinstance(self._mods['MarketData'], Exception):
+            self._test_bar = self._mods['MarketData'](
+                symbol="TEST", timestamp=FIXED_TIMESTAMP,
+                open=100.0, high=101.0, low=99.0, close=100.5,
+                volume=1000, source="test"
+            )
+    
+    def _mod(self, name):
+        """A shared sidecar class, raising its import error if it failed to load"""
+        obj = self._mods[name]
+        if isinstance(obj, Exception):
+            raise obj
+        return obj
+    
+    async def _run_phase(self, phase):
+        """Run one phase with its own output line buffer and result list"""
+        out, records = [], []
+        _phase.set((out, records))  # this task's context only
+        if asyncio.iscoroutinefunction(phase):
+            await phase()
+        else:
+            # Sync (filesystem) phases run on the default thread pool
+            ctx = contextvars.copy_context()
+            await asyncio.get_running_loop().run_in_executor(None, ctx.run, phase)
+        return out, records
+    
+    async def run_phases(self, *phases):
+        """
+        Run phases concurrently, then print their output and tally their
+        results in the order given.
+        """
+        finished = await asyncio.gather(*(self._run_phase(phase) for phase in phases))
+        for out, records in finished:
+            # One write per phase instead of one print per test
+            sys.stdout.write(''.join(out))
+            for record in records:
+                self._tally(*record)
+        sys.stdout.flush()
+    
+    def _get_md_count(self):
+        """Number of markdown files in the repo root, counted once and cached"""
+        if self._md_count is None:
+            with os.scandir('.') as it:
+                self._md_count = sum(1 for e in it if e.name.endswith('.md') and e.is_file())
+        return self._md_count
+    
+    def _stat_batch(self, paths):
+        """
+        Map each path to its DirEntry (None if missing).
+
+        Each parent directory is listed once; size and mode come from the
+        entry's cached stat().
+        """
+        listings = {}
+        for dirname in {os.path.dirname(path) or '.' for path in paths}:
+            try:
+                with os.scandir(dirname) as it:
+                    listings[dirname] = {e.name: e for e in it}
+            except OSError:
+                listings[dirname] = {}
+        
+        return {path: listings[os.path.dirname(path) or '.'].get(os.path.basename(path))
+                for path in paths}
     
     def test_file_structure(self):
         """Test system file structure and organization"""
         self.print_section("1. SYSTEM STRUCTURE VALIDATION")
         
         # Test main directories
-        required_dirs = [
-            'sidecar', 'dashboard', 'mt5_ea', 'scripts', 'deploy', 'tests', 'data', 'logs', 'models'
-        ]
-        
-        for dir_name in required_dirs:
+        for dir_name in _REQUIRED_DIRS:
             exists = os.path.exists(dir_name)
             self.record_test('Structure', f'Directory {dir_name}', exists)
         
         # Test key files
-        key_files = [
-            'sidecar/app/main.py',
-            'sidecar/app/data/high_frequency_orchestrator.py',
-            'mt5_ea/QuantSupraAI.mq5',
-            'dashboard/package.json',
-            'ecosystem.config.js',
-            'README.md',
-            'vproptraderPRD.txt'
-        ]
-        
-        for file_path in key_files:
+        for file_path in _KEY_FILES:
             exists = os.path.exists(file_path)
             self.record_test('Structure', f'File {file_path}', exists)
         
-        # Count total files
-        total_files = sum(len(files) for _, _, files in os.walk('.'))
-        self.record_test('Structure', f'Total files count', total_files > 200, f'({total_files} files)')
+        # Count total files (stops counting once past the threshold)
+        total_files = _count_files_fast('.', threshold=201)
+        shown = '200+' if total_files > 200 else total_files
+        self.record_test('Structure', f'Total files count', total_files > 200, f'({shown} files)')
         
         # Count documentation files
-        md_files = list(Path('.').glob('*.md'))
-        self.record_test('Structure', f'Documentation files', len(md_files) > 50, f'({len(md_files)} files)')
+        md_count = self._get_md_count()
+        self.record_test('Structure', f'Documentation files', md_count > 50, f'({md_count} files)')
     
     async def test_sidecar_components(self):
         """Test all sidecar components"""
         self.print_section("2. SIDECAR SERVICE VALIDATION")
         
-        original_dir = os.getcwd()
+        self._ensure_sidecar_loaded()
+        
+        # Import groups load on this thread: imports serialize on the import
+        # lock anyway, and native thread pools started by a module import
+        # (Numba) off the main thread keep the interpreter from exiting. A
+        # failure is recorded against its own group; the others still run.
+        components = {}
+        for label, names in _SIDECAR_IMPORTS:
+            try:
+                components.update(_import_group(names))
+                self.record_test('Sidecar', label, True)
+            except Exception as e:
+                self.record_test('Sidecar', label, False, str(e))
+        
+        # Component checks only run when the classes they need imported
+        SymbolMapper = components.get('SymbolMapper')
+        if SymbolMapper is not None:
+            try:
+                symbol_mapper = SymbolMapper()
+                self.record_test('Sidecar', 'SymbolMapper initialization', True)
+                
+                # Test symbol mapping
+                generic = symbol_mapper.to_generic_symbol("US100.e")
+                broker = symbol_mapper.to_broker_symbol("NAS100")
+                yahoo = symbol_mapper.to_yahoo_symbol("NAS100")
+                
+                mapping_correct = (generic == "NAS100" and 
+                                 broker == "US100.e" and 
+                                 yahoo == "NQ=F")
+                self.record_test('Sidecar', 'Symbol mapping', mapping_correct, 
+                               f'US100.e→{generic}, NAS100→{broker}, NAS100→{yahoo}')
+            except Exception as e:
+                self.record_test('Sidecar', 'Symbol mapping', False, str(e))
+        
+        CircuitBreaker = components.get('CircuitBreaker')
+        if CircuitBreaker is not None:
+            try:
+                breaker = CircuitBreaker(failure_threshold=2, timeout_seconds=1)
+                
+                async def test_func(): return "ok"
+                result = await breaker.call(test_func)
+                
+                self.record_test('Sidecar', 'Circuit breaker', result == "ok")
+            except Exception as e:
+                self.record_test('Sidecar', 'Circuit breaker', False, str(e))
+        
+        # Test data validation
         try:
-            # Add sidecar to Python path
-            sidecar_path = os.path.join(original_dir, 'sidecar')
-            if sidecar_path not in sys.path:
-                sys.path.insert(0, sidecar_path)
-            
-            # Core components
-            from app.data.high_frequency_orchestrator import HighFrequencyDataOrchestrator
-            self.record_test('Sidecar', 'Orchestrator import', True)
-            
-            from app.data.yahoo_fetcher import YahooFinanceFetcher
-            from app.data.alphavantage_fetcher import AlphaVantageFetcher
-            from app.data.twelvedata_fetcher import TwelveDataFetcher
-            from app.data.polygon_fetcher import PolygonFetcher
-            self.record_test('Sidecar', 'Data fetchers import', True)
-            
-            from app.data.redis_knowledge_base import RedisKnowledgeBase
-            from app.data.sqlite_store import SQLiteHistoricalStore
-            self.record_test('Sidecar', 'Storage components import', True)
-            
-            from app.data.feature_engine import IncrementalFeatureEngine
-            from app.data.circuit_breaker import CircuitBreaker
-            from app.data.symbol_mapper import SymbolMapper
-            self.record_test('Sidecar', 'Processing components import', True)
-            
-            from app.ml.lstm_model import LSTMModel
-            from app.ml.random_forest import RandomForestModel
-            from app.ml.gbt_meta_learner import GBTMetaLearner
-            self.record_test('Sidecar', 'ML models import', True)
-            
-            from app.scanner.scanner import GlobalScanner
-            from app.risk.position_sizing import PositionSizer
-            self.record_test('Sidecar', 'Trading components import', True)
-            
-            # Test component initialization
-            symbol_mapper = SymbolMapper()
-            self.record_test('Sidecar', 'SymbolMapper initialization', True)
-            
-            # Test symbol mapping
-            generic = symbol_mapper.to_generic_symbol("US100.e")
-            broker = symbol_mapper.to_broker_symbol("NAS100")
-            yahoo = symbol_mapper.to_yahoo_symbol("NAS100")
-            
-            mapping_correct = (generic == "NAS100" and 
-                             broker == "US100.e" and 
-                             yahoo == "NQ=F")
-            self.record_test('Sidecar', 'Symbol mapping', mapping_correct, 
-                           f'US100.e→{generic}, NAS100→{broker}, NAS100→{yahoo}')
-            
-            # Test circuit breaker
-            from app.data.circuit_breaker import CircuitState
-            breaker = CircuitBreaker(failure_threshold=2, timeout_seconds=1)
-            
-            async def test_func(): return "ok"
-            result = await breaker.call(test_func)
-            
-            self.record_test('Sidecar', 'Circuit breaker', result == "ok")
-            
-            # Test data validation
-            from app.data.data_validator import DataValidator
-            from app.data.base_fetcher import MarketData
-            
-            validator = DataValidator()
-            test_bar = MarketData(
-                symbol="TEST", timestamp=datetime.now(),
-                open=100.0, high=101.0, low=99.0, close=100.5,
-                volume=1000, source="test"
-            )
-            
-            validation_result = validator.validate(test_bar)
+            validator = self._mod('DataValidator')()
+            validation_result = validator.validate(self._test_bar)
             is_valid = getattr(validation_result, 'is_valid', validation_result)
             self.record_test('Sidecar', 'Data validation', bool(is_valid))
-            
         except Exception as e:
-            self.record_test('Sidecar', 'Component testing', False, str(e))
-        finally:
-            os.chdir(original_dir)
+            self.record_test('Sidecar', 'Data validation', False, str(e))
     
     def test_mt5_ea_structure(self):
         """Test MT5 EA file structure"""
         self.print_section("3. MT5 EXPERT ADVISOR VALIDATION")
         
         # Test MQL5 files
-        mql_files = [
-            'mt5_ea/QuantSupraAI.mq5',
-            'mt5_ea/Include/TradeEngine.mqh',
-            'mt5_ea/Include/RiskManager.mqh',
-            'mt5_ea/Include/RestClient.mqh',
-            'mt5_ea/Include/Governors.mqh',
-            'mt5_ea/Include/Structures.mqh',
-            'mt5_ea/config.mqh'
-        ]
-        
-        for file_path in mql_files:
-            exists = os.path.exists(file_path)
-            if exists:
+        entries = self._stat_batch(_MQL_FILES)
+        for file_path, entry in entries.items():
+            if entry is not None:
                 # Check file size (should not be empty)
-                size = os.path.getsize(file_path)
+                size = entry.stat().st_size
                 self.record_test('MT5_EA', f'{os.path.basename(file_path)}', size > 0, f'({size} bytes)')
             else:
                 self.record_test('MT5_EA', f'{os.path.basename(file_path)}', False, 'File not found')
         
-        # Test main EA file content
-        if os.path.exists('mt5_ea/QuantSupraAI.mq5'):
-            with open('mt5_ea/QuantSupraAI.mq5', 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                has_ontick = 'OnTick' in content
-                has_oninit = 'OnInit' in content
-                has_ondeinit = 'OnDeinit' in content or 'void OnDeinit' in content
-                
-                self.record_test('MT5_EA', 'Main EA functions', 
-                               has_ontick and has_oninit and has_ondeinit,
-                               f'OnTick: {has_ontick}, OnInit: {has_oninit}, OnDeinit: {has_ondeinit}')
+        # Test main EA file content (mmap can't map an empty file)
+        main_ea = entries['mt5_ea/QuantSupraAI.mq5']
+        if main_ea is not None and main_ea.stat().st_size > 0:
+            # Memory-mapped bytes: searched in place, no decode and no copy into a str
+            with open(main_ea.path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                has_ontick = mm.find(b'OnTick') != -1
+                has_oninit = mm.find(b'OnInit') != -1
+                has_ondeinit = mm.find(b'OnDeinit') != -1
+            
+            self.record_test('MT5_EA', 'Main EA functions', 
+                           has_ontick and has_oninit and has_ondeinit,
+                           f'OnTick: {has_ontick}, OnInit: {has_oninit}, OnDeinit: {has_ondeinit}')
     
     def test_dashboard_structure(self):
         """Test dashboard structure"""
         self.print_section("4. DASHBOARD VALIDATION")
         
+        # Test key React files
+        entries = self._stat_batch(_DASHBOARD_FILES)
+        
         # Test package.json
-        package_json_exists = os.path.exists('dashboard/package.json')
+        package_json_exists = entries['dashboard/package.json'] is not None
         self.record_test('Dashboard', 'package.json', package_json_exists)
         
         if package_json_exists:
             try:
-                with open('dashboard/package.json', 'r') as f:
-                    package_data = json.load(f)
+                with open('dashboard/package.json', 'rb') as f:
+                    package_data = _loads(f.read())
                     has_next = 'next' in package_data.get('dependencies', {})
                     has_react = 'react' in package_data.get('dependencies', {})
                     
@@ -249,41 +453,28 @@ class SystemTester:
             except Exception as e:
                 self.record_test('Dashboard', 'package.json parsing', False, str(e))
         
-        # Test key React files
-        react_files = [
-            'dashboard/src/app/page.tsx',
-            'dashboard/src/app/layout.tsx',
-            'dashboard/src/app/trades/page.tsx',
-            'dashboard/src/app/performance/page.tsx',
-            'dashboard/src/components/Navigation.tsx'
-        ]
-        
-        for file_path in react_files:
-            exists = os.path.exists(file_path)
+        for file_path in _REACT_FILES:
+            exists = entries[file_path] is not None
             self.record_test('Dashboard', f'{os.path.basename(file_path)}', exists)
     
     async def test_data_pipeline(self):
         """Test complete data pipeline"""
         self.print_section("5. DATA PIPELINE VALIDATION")
         
-        original_dir = os.getcwd()
         try:
-            # Add sidecar to Python path
-            sidecar_path = os.path.join(original_dir, 'sidecar')
-            if sidecar_path not in sys.path:
-                sys.path.insert(0, sidecar_path)
+            self._ensure_sidecar_loaded()
             
             # Test Redis connection
             try:
                 import redis
-                r = redis.Redis(host='localhost', port=6379, db=0)
+                r = redis.Redis(host='localhost', port=6379, db=0, socket_timeout=1)
                 pong = r.ping()
                 self.record_test('Pipeline', 'Redis connection', pong)
                 
-                # Test Redis operations
-                r.set('test_key', 'test_value')
-                value = r.get('test_key')
-                r.delete('test_key')
+                # Test Redis operations (SET/GET/DEL in one round trip)
+                with r.pipeline(transaction=False) as pipe:
+                    pipe.set('test_key', 'test_value').get('test_key').delete('test_key')
+                    _, value, _ = pipe.execute()
                 self.record_test('Pipeline', 'Redis operations', value == b'test_value')
                 
             except Exception as e:
@@ -297,18 +488,10 @@ class SystemTester:
             self.record_test('Pipeline', 'Yahoo fetcher init', True)
             
             # Test feature engine
-            from app.data.feature_engine import IncrementalFeatureEngine
-            from app.data.base_fetcher import MarketData
-            
-            engine = IncrementalFeatureEngine()
-            test_bar = MarketData(
-                symbol="TEST", timestamp=datetime.now(),
-                open=100.0, high=101.0, low=99.0, close=100.5,
-                volume=1000, source="test"
-            )
+            engine = self._mod('IncrementalFeatureEngine')()
+            test_bar = self._test_bar
             
-            history = [test_bar] * 50
-            features = await engine.compute_features("TEST", test_bar, history)
+            features = await engine.compute_features("TEST", test_bar, [test_bar] * 50)
             
             self.record_test('Pipeline', 'Feature computation', len(features) > 0, 
                            f'{len(features)} features')
@@ -317,118 +500,85 @@ class SystemTester:
             
         except Exception as e:
             self.record_test('Pipeline', 'Data pipeline test', False, str(e))
-        finally:
-            os.chdir(original_dir)
     
     def test_configuration(self):
         """Test system configuration"""
         self.print_section("6. CONFIGURATION VALIDATION")
         
         # Test environment files
-        env_files = [
-            'sidecar/.env',
-            'sidecar/.env.example',
-            'dashboard/.env.local',
-            'dashboard/.env.example'
-        ]
-        
-        for file_path in env_files:
-            exists = os.path.exists(file_path)
+        entries = self._stat_batch(_CONFIG_FILES)
+        
+        for file_path in _ENV_FILES:
+            exists = entries[file_path] is not None
             self.record_test('Config', f'{file_path}', exists)
         
         # Test ecosystem.config.js
-        ecosystem_exists = os.path.exists('ecosystem.config.js')
+        ecosystem_exists = entries['ecosystem.config.js'] is not None
         self.record_test('Config', 'ecosystem.config.js', ecosystem_exists)
         
         # Test deployment scripts
-        deploy_scripts = [
-            'scripts/setup_and_start.sh',
-            'scripts/monitor.sh',
-            'scripts/go_live.sh',
-            'deploy/deploy_sidecar.sh',
-            'deploy/deploy_dashboard.sh'
-        ]
-        
-        for script in deploy_scripts:
-            exists = os.path.exists(script)
-            executable = os.access(script, os.X_OK) if exists else False
-            self.record_test('Config', f'{os.path.basename(script)}', exists and executable,
-                           'executable' if executable else 'not executable')
+        for script in _DEPLOY_SCRIPTS:
+            # One access(2) answers "exists and executable"; lexists only on failure
+            if os.access(script, os.F_OK | os.X_OK):
+                self.record_test('Config', f'{os.path.basename(script)}', True, 'executable')
+            else:
+                exists = os.path.lexists(script)
+                self.record_test('Config', f'{os.path.basename(script)}', False,
+                               'not executable' if exists else 'missing')
     
     def test_documentation(self):
         """Test documentation completeness"""
         self.print_section("7. DOCUMENTATION VALIDATION")
         
         # Count markdown files
-        md_files = list(Path('.').glob('*.md'))
-        self.record_test('Docs', 'Documentation files', len(md_files) > 50, f'{len(md_files)} files')
+        md_count = self._get_md_count()
+        self.record_test('Docs', 'Documentation files', md_count > 50, f'{md_count} files')
         
         # Test key documentation
-        key_docs = [
-            'README.md',
-            'SETUP_GUIDE.md',
-            'DEPLOYMENT_GUIDE.md',
-            'FINAL_TEST_REPORT.md',
-            'COMPLETE_SYSTEM_ANALYSIS.md'
-        ]
-        
-        for doc in key_docs:
-            exists = os.path.exists(doc)
-            if exists:
-                size = os.path.getsize(doc)
+        for doc in _KEY_DOCS:
+            try:
+                size = os.stat(doc).st_size
                 self.record_test('Docs', doc, size > 1000, f'{size} bytes')
-            else:
+            except FileNotFoundError:
                 self.record_test('Docs', doc, False, 'Not found')
     
     async def test_performance(self):
         """Test system performance"""
         self.print_section("8. PERFORMANCE VALIDATION")
         
-        original_dir = os.getcwd()
         try:
-            # Add sidecar to Python path
-            sidecar_path = os.path.join(original_dir, 'sidecar')
-            if sidecar_path not in sys.path:
-                sys.path.insert(0, sidecar_path)
+            self._ensure_sidecar_loaded()
             
             # Test data validation performance
-            from app.data.data_validator import DataValidator
-            from app.data.base_fetcher import MarketData
+            validator = self._mod('DataValidator')()
+            test_bar = self._test_bar
             
-            validator = DataValidator()
-            test_bar = MarketData(
-                symbol="TEST", timestamp=datetime.now(),
-                open=100.0, high=101.0, low=99.0, close=100.5,
-                volume=1000, source="test"
-            )
+            # Warm up first so the timed window measures steady state, not the
+            # interpreter's adaptive specialization (or a JIT's tracing) of the hot path
+            validate = validator.validate
+            for _ in range(200):
+                validate(test_bar)
             
-            # Benchmark 1000 validations
-            start_time = time.time()
-            for _ in range(1000):
-                validator.validate(test_bar)
-            elapsed = time.time() - start_time
+            # Benchmark validations; autorange picks a loop count well above timer resolution
+            loops, elapsed = Timer('v(bar)', globals={'v': validate, 'bar': test_bar}).autorange()
             
-            per_validation_ms = (elapsed / 1000) * 1000
+            per_validation_ms = (elapsed / loops) * 1000
             self.record_test('Performance', 'Data validation speed', 
                            per_validation_ms < 1.0, f'{per_validation_ms:.3f}ms per validation')
             
             # Test symbol mapping performance
-            from app.data.symbol_mapper import SymbolMapper
-            
-            mapper = SymbolMapper()
-            start_time = time.time()
-            for _ in range(10000):
-                mapper.to_generic_symbol("US100.e")
-            elapsed = time.time() - start_time
+            mapper = self._mod('SymbolMapper')()
+            to_generic = mapper.to_generic_symbol
+            for _ in range(200):
+                to_generic("US100.e")
+            loops, elapsed = Timer('m("US100.e")', globals={'m': to_generic}).autorange()
             
-            per_mapping_us = (elapsed / 10000) * 1000000
+            per_mapping_us = (elapsed / loops) * 1000000
             self.record_test('Performance', 'Symbol mapping speed',
                            per_mapping_us < 100, f'{per_mapping_us:.1f}μs per mapping')
             
         except Exception as e:
             self.record_test('Performance', 'Performance testing', False, str(e))
-        finally:
-            os.chdir(original_dir)
     
     def test_database_files(self):
         """Test database and data files"""
@@ -437,10 +587,10 @@ class SystemTester:
         # Test database files (only check the active one)
         primary_db = 'sidecar/data/vproptrader.db'
         
-        if os.path.exists(primary_db):
-            size = os.path.getsize(primary_db)
+        try:
+            size = os.stat(primary_db).st_size
             self.record_test('Database', 'Primary database', size > 0, f'{size} bytes')
-        else:
+        except FileNotFoundError:
             self.record_test('Database', 'Primary database', False, 'Not found')
         
         # Check if database directory exists
@@ -498,16 +648,19 @@ async def main():
     print(f"{Colors.BLUE}Testing all 206+ files across 40 directories{Colors.END}")
     print(f"{Colors.BLUE}Comprehensive validation of entire trading system{Colors.END}")
     
-    # Run all tests
-    tester.test_file_structure()
-    await tester.test_sidecar_components()
-    tester.test_mt5_ea_structure()
-    tester.test_dashboard_structure()
-    await tester.test_data_pipeline()
-    tester.test_configuration()
-    tester.test_documentation()
-    await tester.test_performance()
-    tester.test_database_files()
+    # Run the checks concurrently; output and tallies stay in this order
+    await tester.run_phases(
+        tester.test_file_structure,
+        tester.test_sidecar_components,
+        tester.test_mt5_ea_structure,
+        tester.test_dashboard_structure,
+        tester.test_data_pipeline,
+        tester.test_configuration,
+        tester.test_documentation,
+    )
+    # Timings run alone so the other phases' threads don't skew them
+    await tester.run_phases(tester.test_performance)
+    await tester.run_phases(tester.test_database_files)
     
     # Print summary and return exit code
     return tester.print_summary()
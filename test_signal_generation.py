@@ -5,7 +5,18 @@ Test script to verify signal generation with ES95 constraints
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+
+SIGNALS_URL = "http://localhost:8002/api/signals"
+
+def _fetch_signals(session, equity):
+    """GET signals for one equity level; returns the response or the request error"""
+    try:
+        return session.get(SIGNALS_URL, params={"equity": equity}, timeout=10)
+    except requests.exceptions.RequestException as e:
+        return e
 
 def test_signal_generation():
     """Test the signal generation API"""
@@ -18,17 +29,21 @@ def test_signal_generation():
     # Test with different equity levels
     equity_levels = [1000, 5000, 10000]
     
-    for equity in equity_levels:
+    # One keep-alive session; the independent requests go out together
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(equity_levels))
+        session.mount("http://", adapter)
+        with ThreadPoolExecutor(max_workers=len(equity_levels)) as executor:
+            responses = list(executor.map(lambda eq: _fetch_signals(session, eq), equity_levels))
+    
+    for equity, response in zip(equity_levels, responses):
         print(f"\n{'='*80}")
         print(f"Testing with Equity: ${equity}")
         print(f"{'='*80}")
         
         try:
-            response = requests.get(
-                f"http://localhost:8002/api/signals",
-                params={"equity": equity},
-                timeout=10
-            )
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 data = response.json()
@@ -1,6 +1,7 @@
 """Unit tests for hard and soft governors"""
 
 import pytest
+import numpy as np
 from datetime import datetime, time
 import sys
 from pathlib import Path
@@ -8,6 +9,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "sidecar"))
 
 
+def _assert_matches(actual, expected, descriptions):
+    """Assert a vectorized check against its expected column, naming failed rows"""
+    failed = [d for d, ok in zip(descriptions, actual == expected) if not ok]
+    assert np.array_equal(actual, expected), f"Failed: {', '.join(failed)}"
+
+
+def _minutes(times):
+    """datetime.time values as int minutes since midnight"""
+    return np.array([t.hour * 60 + t.minute for t in times])
+
+
 class TestHardGovernors:
     """Test hard governor enforcement"""
     
@@ -24,12 +36,12 @@ class TestHardGovernors:
             (950.0, -50.0, False, "Exceeded limit"),
         ]
         
-        for current_equity, daily_pnl, should_allow, description in test_cases:
-            # Simulate governor check
-            is_allowed = daily_pnl > daily_loss_limit
-            
-            assert is_allowed == should_allow, f"Failed: {description}"
-            print(f"✓ {description}: PnL=${daily_pnl:.2f}, Allowed={is_allowed}")
+        current_equity, daily_pnl, should_allow, descriptions = map(np.array, zip(*test_cases))
+        
+        # Simulate governor check
+        is_allowed = daily_pnl > daily_loss_limit
+        
+        _assert_matches(is_allowed, should_allow, descriptions)
     
     def test_total_loss_limit(self):
         """Test total loss limit at $900 equity"""
@@ -42,11 +54,10 @@ class TestHardGovernors:
             (850.0, False, "Below limit"),
         ]
         
-        for equity, should_allow, description in test_cases:
-            is_allowed = equity > total_loss_limit
-            
-            assert is_allowed == should_allow, f"Failed: {description}"
-            print(f"✓ {description}: Equity=${equity:.2f}, Allowed={is_allowed}")
+        equity, should_allow, descriptions = map(np.array, zip(*test_cases))
+        is_allowed = equity > total_loss_limit
+        
+        _assert_matches(is_allowed, should_allow, descriptions)
     
     def test_profit_target(self):
         """Test profit target halt at $100"""
@@ -59,11 +70,10 @@ class TestHardGovernors:
             (150.0, False, "Above target"),
         ]
         
-        for total_pnl, should_allow, description in test_cases:
-            is_allowed = total_pnl < profit_target
-            
-            assert is_allowed == should_allow, f"Failed: {description}"
-            print(f"✓ {description}: PnL=${total_pnl:.2f}, Allowed={is_allowed}")
+        total_pnl, should_allow, descriptions = map(np.array, zip(*test_cases))
+        is_allowed = total_pnl < profit_target
+        
+        _assert_matches(is_allowed, should_allow, descriptions)
     
     def test_daily_profit_cap(self):
         """Test daily profit cap at 1.8%"""
@@ -78,19 +88,18 @@ class TestHardGovernors:
             (25.0, False, "Above cap"),
         ]
         
-        for daily_pnl, should_allow, description in test_cases:
-            is_allowed = daily_pnl < daily_profit_cap
-            
-            assert is_allowed == should_allow, f"Failed: {description}"
-            print(f"✓ {description}: Daily PnL=${daily_pnl:.2f}, Allowed={is_allowed}")
+        daily_pnl, should_allow, descriptions = map(np.array, zip(*test_cases))
+        is_allowed = daily_pnl < daily_profit_cap
+        
+        _assert_matches(is_allowed, should_allow, descriptions)
     
     def test_time_based_close(self):
         """Test time-based position closing"""
         # 21:45 UTC weekday close
-        weekday_close = time(21, 45)
+        weekday_close = 21 * 60 + 45
         
         # Friday 20:00 UTC close
-        friday_close = time(20, 0)
+        friday_close = 20 * 60
         
         test_times = [
             (time(14, 30), 2, False, "Tuesday afternoon"),
@@ -101,15 +110,15 @@ class TestHardGovernors:
             (time(20, 0), 4, True, "Friday at close"),
         ]
         
-        for current_time, weekday, should_close, description in test_times:
-            # Simulate time check
-            if weekday == 4:  # Friday
-                should_close_calc = current_time >= friday_close
-            else:
-                should_close_calc = current_time >= weekday_close
-            
-            assert should_close_calc == should_close, f"Failed: {description}"
-            print(f"✓ {description}: Time={current_time}, Close={should_close}")
+        current_time, weekday, should_close, descriptions = zip(*test_times)
+        minutes = _minutes(current_time)
+        weekday = np.array(weekday)
+        
+        # Simulate time check (weekday 4 is Friday)
+        close_at = np.where(weekday == 4, friday_close, weekday_close)
+        should_close_calc = minutes >= close_at
+        
+        _assert_matches(should_close_calc, np.array(should_close), descriptions)
 
 
 class TestSoftGovernors:
@@ -119,22 +128,34 @@ class TestSoftGovernors:
         """Test cool-down period after losses"""
         cooldown_seconds = 300  # 5 minutes
         
-        # Simulate consecutive losses
-        consecutive_losses = 0
+        # Trade outcomes as a bitset: bit 0 is the latest trade, 1 = loss
+        history_bits = 64
         max_consecutive = 2
+        window = (1 << max_consecutive) - 1
+        
+        def record(bits, is_loss):
+            """Shift in the newest outcome, keeping the last history_bits trades"""
+            return ((bits << 1) | int(is_loss)) & ((1 << history_bits) - 1)
         
         test_cases = [
-            (0, False, "No losses"),
-            (1, False, "One loss"),
-            (2, True, "Two losses - cooldown"),
-            (3, True, "Three losses - cooldown"),
+            (0b0, False, "No losses"),
+            (0b1, False, "One loss"),
+            (0b11, True, "Two losses - cooldown"),
+            (0b111, True, "Three losses - cooldown"),
+            (0b101, False, "Loss, win, loss - not consecutive"),
         ]
         
-        for losses, should_pause, description in test_cases:
-            should_pause_calc = losses >= max_consecutive
+        for bits, should_pause, description in test_cases:
+            # Pause when every trade in the window was a loss (popcount of the window)
+            should_pause_calc = (bits & window).bit_count() >= max_consecutive
             
             assert should_pause_calc == should_pause, f"Failed: {description}"
-            print(f"✓ {description}: Losses={losses}, Pause={should_pause}")
+        
+        # Driving the bitset trade by trade gives the same answers
+        bits = 0
+        for is_loss, should_pause in [(True, False), (True, True), (False, False), (True, False)]:
+            bits = record(bits, is_loss)
+            assert ((bits & window).bit_count() >= max_consecutive) == should_pause
     
     def test_volatility_cap(self):
         """Test volatility cap governor"""
@@ -147,11 +168,10 @@ class TestSoftGovernors:
             (0.04, False, "High volatility"),
         ]
         
-        for volatility, should_allow, description in test_cases:
-            is_allowed = volatility < max_volatility
-            
-            assert is_allowed == should_allow, f"Failed: {description}"
-            print(f"✓ {description}: Vol={volatility:.3f}, Allowed={is_allowed}")
+        volatility, should_allow, descriptions = map(np.array, zip(*test_cases))
+        is_allowed = volatility < max_volatility
+        
+        _assert_matches(is_allowed, should_allow, descriptions)
     
     def test_profit_lock(self):
         """Test profit lock mechanism"""
@@ -166,81 +186,75 @@ class TestSoftGovernors:
             (30.0, 25.0, True, "Below lock threshold"),
         ]
         
-        for peak_pnl, current_pnl, should_allow, description in test_cases:
-            if peak_pnl >= profit_lock_threshold:
-                giveback = peak_pnl - current_pnl
-                max_giveback = peak_pnl * max_giveback_pct
-                is_allowed = giveback <= max_giveback
-            else:
-                is_allowed = True
-            
-            assert is_allowed == should_allow, f"Failed: {description}"
-            print(f"✓ {description}: Peak=${peak_pnl:.2f}, Current=${current_pnl:.2f}, Allowed={is_allowed}")
+        peak_pnl, current_pnl, should_allow, descriptions = map(np.array, zip(*test_cases))
+        
+        # Giveback only applies once the peak has reached the lock threshold
+        giveback = peak_pnl - current_pnl
+        max_giveback = peak_pnl * max_giveback_pct
+        is_allowed = (peak_pnl < profit_lock_threshold) | (giveback <= max_giveback)
+        
+        _assert_matches(is_allowed, should_allow, descriptions)
 
 
 class TestTradingSchedule:
     """Test trading schedule enforcement"""
     
-    def test_london_session(self):
+    @pytest.mark.parametrize(("current_time", "should_trade"), [
+        (time(6, 59), False),
+        (time(7, 0), True),
+        (time(8, 30), True),
+        (time(10, 0), False),
+        (time(10, 1), False),
+    ], ids=["before_london", "london_start", "during_london", "london_end", "after_london"])
+    def test_london_session(self, current_time, should_trade):
         """Test London session (07:00-10:00 UTC)"""
         london_start = time(7, 0)
         london_end = time(10, 0)
         
-        test_times = [
-            (time(6, 59), False, "Before London"),
-            (time(7, 0), True, "London start"),
-            (time(8, 30), True, "During London"),
-            (time(10, 0), False, "London end"),
-            (time(10, 1), False, "After London"),
-        ]
-        
-        for current_time, should_trade, description in test_times:
-            is_allowed = london_start <= current_time < london_end
-            
-            assert is_allowed == should_trade, f"Failed: {description}"
-            print(f"✓ {description}: Time={current_time}, Trade={is_allowed}")
+        assert (london_start <= current_time < london_end) == should_trade
     
-    def test_ny_session(self):
+    @pytest.mark.parametrize(("current_time", "should_trade"), [
+        (time(13, 29), False),
+        (time(13, 30), True),
+        (time(14, 45), True),
+        (time(16, 0), False),
+        (time(16, 1), False),
+    ], ids=["before_ny", "ny_start", "during_ny", "ny_end", "after_ny"])
+    def test_ny_session(self, current_time, should_trade):
         """Test NY session (13:30-16:00 UTC)"""
         ny_start = time(13, 30)
         ny_end = time(16, 0)
         
-        test_times = [
-            (time(13, 29), False, "Before NY"),
-            (time(13, 30), True, "NY start"),
-            (time(14, 45), True, "During NY"),
-            (time(16, 0), False, "NY end"),
-            (time(16, 1), False, "After NY"),
-        ]
-        
-        for current_time, should_trade, description in test_times:
-            is_allowed = ny_start <= current_time < ny_end
-            
-            assert is_allowed == should_trade, f"Failed: {description}"
-            print(f"✓ {description}: Time={current_time}, Trade={is_allowed}")
+        assert (ny_start <= current_time < ny_end) == should_trade
     
     def test_combined_sessions(self):
         """Test combined London and NY sessions"""
-        london_start = time(7, 0)
-        london_end = time(10, 0)
-        ny_start = time(13, 30)
-        ny_end = time(16, 0)
+        # Sessions as (start minute, length in minutes) since midnight UTC
+        london_start, london_len = 7 * 60, 180       # 07:00-10:00
+        ny_start, ny_len = 13 * 60 + 30, 150         # 13:30-16:00
         
         test_times = [
             (time(6, 0), False, "Before any session"),
+            (time(7, 0), True, "London start"),
             (time(8, 0), True, "London session"),
+            (time(10, 0), False, "London end"),
             (time(12, 0), False, "Between sessions"),
+            (time(13, 30), True, "NY start"),
             (time(14, 0), True, "NY session"),
+            (time(16, 0), False, "NY end"),
             (time(18, 0), False, "After all sessions"),
         ]
         
-        for current_time, should_trade, description in test_times:
-            in_london = london_start <= current_time < london_end
-            in_ny = ny_start <= current_time < ny_end
-            is_allowed = in_london or in_ny
-            
-            assert is_allowed == should_trade, f"Failed: {description}"
-            print(f"✓ {description}: Time={current_time}, Trade={is_allowed}")
+        current_time, should_trade, descriptions = zip(*test_times)
+        minutes = _minutes(current_time)
+        
+        # start <= t < end as one unsigned compare: t before start wraps to a
+        # large uint16, so each window is a subtract + compare with no branch
+        in_london = (minutes - london_start).astype(np.uint16) < london_len
+        in_ny = (minutes - ny_start).astype(np.uint16) < ny_len
+        is_allowed = in_london | in_ny
+        
+        _assert_matches(is_allowed, np.array(should_trade), descriptions)
 
 
 if __name__ == "__main__":
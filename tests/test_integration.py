@@ -4,26 +4,44 @@ import pytest
 import asyncio
 import httpx
 import json
+import statistics
+import time
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "sidecar"))
 
+import pytest_asyncio
+
 from app.main import app
-from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async tests on uvloop when it is installed"""
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Async client calling the ASGI app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
 
 
 class TestIntegration:
     """Test integration between components"""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        return TestClient(app)
-    
-    def test_health_endpoint(self, client):
+    async def test_health_endpoint(self, client):
         """Test health check endpoint"""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         
         data = response.json()
@@ -34,9 +52,12 @@ class TestIntegration:
         print(f"Health check: {data['status']}")
         print(f"Components: {list(data['components'].keys())}")
     
-    def test_signals_endpoint(self, client):
+    async def test_signals_endpoint(self, client):
         """Test signals endpoint (polled by EA)"""
-        response = client.get("/api/signals?equity=1000.0")
+        response = await client.get(
+            "/api/signals",
+            params={"equity": 1000.0, "min_confidence": 0.75, "exclude": "NAS100,XAUUSD"},
+        )
         assert response.status_code == 200
         
         data = response.json()
@@ -52,8 +73,13 @@ class TestIntegration:
             assert "q_star" in signal
             assert "lots" in signal
             print(f"Sample signal: {signal['symbol']} {signal['action']}")
+        
+        # Filters are applied server-side
+        for signal in data['signals']:
+            assert signal['confidence'] >= 0.75
+            assert signal['symbol'] not in ("NAS100", "XAUUSD")
     
-    def test_executions_endpoint(self, client):
+    async def test_executions_endpoint(self, client):
         """Test execution reporting endpoint"""
         execution_data = {
             "trade_id": "test_12345",
@@ -72,16 +98,16 @@ class TestIntegration:
             "q_star": 8.5
         }
         
-        response = client.post("/api/executions", json=execution_data)
+        response = await client.post("/api/executions", json=execution_data)
         assert response.status_code == 200
         
         data = response.json()
         assert "status" in data
         print(f"Execution reported: {data['status']}")
     
-    def test_analytics_overview(self, client):
+    async def test_analytics_overview(self, client):
         """Test analytics overview endpoint"""
-        response = client.get("/api/analytics/overview")
+        response = await client.get("/api/analytics/overview")
         assert response.status_code == 200
         
         data = response.json()
@@ -91,9 +117,9 @@ class TestIntegration:
         
         print(f"Overview: Equity=${data['equity']:.2f}, PnL=${data['pnl_today']:.2f}")
     
-    def test_analytics_compliance(self, client):
+    async def test_analytics_compliance(self, client):
         """Test compliance endpoint"""
-        response = client.get("/api/analytics/compliance")
+        response = await client.get("/api/analytics/compliance")
         assert response.status_code == 200
         
         data = response.json()
@@ -106,9 +132,9 @@ class TestIntegration:
             assert "value" in rule
             print(f"  {rule['name']}: {rule['status']}")
     
-    def test_analytics_alphas(self, client):
+    async def test_analytics_alphas(self, client):
         """Test alphas performance endpoint"""
-        response = client.get("/api/analytics/alphas")
+        response = await client.get("/api/analytics/alphas")
         assert response.status_code == 200
         
         data = response.json()
@@ -121,9 +147,9 @@ class TestIntegration:
             assert "hit_rate" in alpha
             print(f"  {alpha['alpha_id']}: Sharpe={alpha['sharpe']:.2f}")
     
-    def test_analytics_risk(self, client):
+    async def test_analytics_risk(self, client):
         """Test risk metrics endpoint"""
-        response = client.get("/api/analytics/risk")
+        response = await client.get("/api/analytics/risk")
         assert response.status_code == 200
         
         data = response.json()
@@ -133,27 +159,38 @@ class TestIntegration:
         
         print(f"Risk: VaR={data['var_95']:.2f}, ES95={data['es_95']:.2f}")
     
-    def test_api_latency(self, client):
-        """Test API response times < 100ms"""
-        import time
-        
+    async def test_api_latency(self, client):
+        """Test API response times < 100ms, probing all endpoints concurrently"""
         endpoints = [
             "/health",
             "/api/signals?equity=1000",
             "/api/analytics/overview",
             "/api/analytics/compliance",
         ]
+        runs = 5
         
-        for endpoint in endpoints:
+        async def timed_get(endpoint):
             start = time.perf_counter()
-            response = client.get(endpoint)
-            elapsed = (time.perf_counter() - start) * 1000  # ms
-            
-            assert response.status_code == 200
-            assert elapsed < 100, f"{endpoint} too slow: {elapsed:.1f}ms"
-            print(f"{endpoint}: {elapsed:.1f}ms")
+            response = await client.get(endpoint)
+            return response, (time.perf_counter() - start) * 1000  # ms
+        
+        latencies = {endpoint: [] for endpoint in endpoints}
+        for _ in range(runs):
+            results = await asyncio.gather(*(timed_get(ep) for ep in endpoints))
+            for endpoint, (response, elapsed) in zip(endpoints, results):
+                assert response.status_code == 200
+                latencies[endpoint].append(elapsed)
+        
+        for endpoint, samples in latencies.items():
+            worst = max(samples)
+            assert worst < 100, f"{endpoint} too slow: {worst:.1f}ms"
+            print(f"{endpoint}: max {worst:.1f}ms over {runs} runs")
+        
+        all_samples = [ms for samples in latencies.values() for ms in samples]
+        p99 = statistics.quantiles(all_samples, n=100)[98]
+        assert p99 < 100, f"Combined p99 too high: {p99:.1f}ms"
+        print(f"Combined p99: {p99:.1f}ms")
     
-    @pytest.mark.asyncio
     async def test_websocket_connection(self):
         """Test WebSocket connection"""
         # This would require a running server
@@ -164,15 +201,11 @@ class TestIntegration:
 class TestEndToEnd:
     """End-to-end workflow tests"""
     
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
-    
-    def test_complete_trade_flow(self, client):
+    async def test_complete_trade_flow(self, client):
         """Test complete trade flow: signal -> execution -> reporting"""
         
         # 1. Get signals
-        response = client.get("/api/signals?equity=1000.0")
+        response = await client.get("/api/signals?equity=1000.0")
         assert response.status_code == 200
         signals_data = response.json()
         
@@ -201,12 +234,12 @@ class TestEndToEnd:
             "q_star": signal['q_star']
         }
         
-        response = client.post("/api/executions", json=execution_data)
+        response = await client.post("/api/executions", json=execution_data)
         assert response.status_code == 200
         print(f"Step 2: Execution reported")
         
         # 3. Verify in analytics
-        response = client.get("/api/analytics/overview")
+        response = await client.get("/api/analytics/overview")
         assert response.status_code == 200
         overview = response.json()
         print(f"Step 3: Analytics updated - Trades: {overview['trades_today']}")
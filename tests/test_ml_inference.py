@@ -27,18 +27,25 @@ class TestMLInference:
     def test_rf_inference_speed(self):
         """Test Random Forest inference speed < 1ms"""
         # Create dummy features
-        features = np.random.randn(1, 50).astype(np.float32)
+        # One pre-allocated input buffer, refilled in place for every call
+        rng = np.random.default_rng()
+        features = np.empty((1, 50), dtype=np.float32)
+        address = features.__array_interface__['data'][0]
         
         # Warm up
         for _ in range(10):
+            rng.standard_normal(dtype=np.float32, out=features)
             model_manager.rf_model.predict(features)
         
         # Time 100 inferences
         start = time.perf_counter()
         for _ in range(100):
+            rng.standard_normal(dtype=np.float32, out=features)
             prediction = model_manager.rf_model.predict(features)
         elapsed = (time.perf_counter() - start) / 100 * 1000  # ms
         
+        assert features.__array_interface__['data'][0] == address, "Input buffer was reallocated"
+        
         print(f"RF inference time: {elapsed:.3f}ms")
         assert elapsed < 1.0, f"RF inference too slow: {elapsed:.3f}ms"
         assert prediction is not None
@@ -46,18 +53,25 @@ class TestMLInference:
     def test_lstm_inference_speed(self):
         """Test LSTM inference speed < 1ms"""
         # Create dummy sequence
-        sequence = np.random.randn(1, 20, 50).astype(np.float32)
+        # One pre-allocated input buffer, refilled in place for every call
+        rng = np.random.default_rng()
+        sequence = np.empty((1, 20, 50), dtype=np.float32)
+        address = sequence.__array_interface__['data'][0]
         
         # Warm up
         for _ in range(10):
+            rng.standard_normal(dtype=np.float32, out=sequence)
             model_manager.lstm_model.predict(sequence)
         
         # Time 100 inferences
         start = time.perf_counter()
         for _ in range(100):
+            rng.standard_normal(dtype=np.float32, out=sequence)
             prediction = model_manager.lstm_model.predict(sequence)
         elapsed = (time.perf_counter() - start) / 100 * 1000  # ms
         
+        assert sequence.__array_interface__['data'][0] == address, "Input buffer was reallocated"
+        
         print(f"LSTM inference time: {elapsed:.3f}ms")
         assert elapsed < 1.0, f"LSTM inference too slow: {elapsed:.3f}ms"
         assert prediction is not None
@@ -65,18 +79,25 @@ class TestMLInference:
     def test_gbt_inference_speed(self):
         """Test GBT inference speed < 1ms"""
         # Create dummy features
-        features = np.random.randn(1, 10).astype(np.float32)
+        # One pre-allocated input buffer, refilled in place for every call
+        rng = np.random.default_rng()
+        features = np.empty((1, 10), dtype=np.float32)
+        address = features.__array_interface__['data'][0]
         
         # Warm up
         for _ in range(10):
+            rng.standard_normal(dtype=np.float32, out=features)
             model_manager.gbt_model.predict(features)
         
         # Time 100 inferences
         start = time.perf_counter()
         for _ in range(100):
+            rng.standard_normal(dtype=np.float32, out=features)
             prediction = model_manager.gbt_model.predict(features)
         elapsed = (time.perf_counter() - start) / 100 * 1000  # ms
         
+        assert features.__array_interface__['data'][0] == address, "Input buffer was reallocated"
+        
         print(f"GBT inference time: {elapsed:.3f}ms")
         assert elapsed < 1.0, f"GBT inference too slow: {elapsed:.3f}ms"
         assert prediction is not None
@@ -115,11 +136,16 @@ class TestMLInference:
         batch_size = 10
         features = np.random.randn(batch_size, 50).astype(np.float32)
         
+        # Compile the parallel kernel (or load it from cache) outside the timing
+        model_manager.rf_batch_model.predict(features)
+        
         # Time batch inference
         start = time.perf_counter()
-        predictions = model_manager.rf_model.predict(features)
+        predictions = model_manager.rf_batch_model.predict(features)
         elapsed = (time.perf_counter() - start) * 1000  # ms
         
+        np.testing.assert_array_equal(predictions, model_manager.rf_model.predict(features))
+        
         per_sample = elapsed / batch_size
         print(f"Batch inference: {elapsed:.3f}ms total, {per_sample:.3f}ms per sample")
         assert per_sample < 1.0, f"Batch inference too slow: {per_sample:.3f}ms per sample"
@@ -0,0 +1,42 @@
+"""Unit tests for the ONNX-backed Random Forest wrapper"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "sidecar"))
+
+ort = pytest.importorskip("onnxruntime")
+skl2onnx = pytest.importorskip("skl2onnx")
+from sklearn.ensemble import RandomForestClassifier
+from skl2onnx.common.data_types import FloatTensorType
+
+from app.ml.model_manager import ONNXClassifier
+
+
+@pytest.fixture(scope="module")
+def forest():
+    """Small RF fitted on a separable toy problem"""
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((200, 5)).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] > 0).astype(int)
+    return RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y), X
+
+
+@pytest.mark.parametrize("zipmap", [False, True], ids=["tensor", "zipmap"])
+def test_onnx_classifier_matches_sklearn(forest, zipmap):
+    """Both skl2onnx output layouts give sklearn's labels and P(win)"""
+    rf, X = forest
+    onx = skl2onnx.convert_sklearn(
+        rf,
+        initial_types=[("X", FloatTensorType([None, X.shape[1]]))],
+        options={id(rf): {"zipmap": zipmap}}
+    )
+    session = ort.InferenceSession(onx.SerializeToString(), providers=["CPUExecutionProvider"])
+    clf = ONNXClassifier(session)
+
+    assert clf.zipmap == zipmap
+    np.testing.assert_array_equal(clf.predict(X), rf.predict(X))
+    np.testing.assert_allclose(clf.predict_proba(X), rf.predict_proba(X)[:, 1], atol=1e-5)
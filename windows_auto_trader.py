@@ -5,16 +5,94 @@ Polls sidecar for signals and executes trades automatically in MT5
 
 import MetaTrader5 as mt5
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import sys
+import threading
 import time
 from datetime import datetime
-import json
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+    try:
+        from orjson import loads as _loads
+    except ImportError:
+        from json import loads as _loads
+    from dataclasses import dataclass, fields
 
 # Configuration
 SIDECAR_URL = "http://3.111.22.56:8002"
 POLL_INTERVAL = 2  # seconds
+STREAM_READ_TIMEOUT = 30  # seconds without a frame before the stream is considered dead
 MIN_CONFIDENCE = 0.75  # Only trade signals above this confidence
 MAX_CONCURRENT_TRADES = 3
 MAGIC_NUMBER = 20251025
+SYMBOL_INFO_TTL = 3600  # seconds before cached symbol info is re-fetched
+VERBOSE = True  # list every open position in monitor_positions
+
+# One pooled keep-alive session for all sidecar requests, so each poll
+# reuses the open connection instead of reconnecting
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+SESSION.headers["Connection"] = "keep-alive"
+
+# symbol -> (mt5 symbol info, monotonic fetch time); see get_symbol_info()
+SYMBOL_INFO_CACHE = {}
+
+# (symbol, order type) -> the fixed fields of its order request; see trade_request()
+TRADE_TEMPLATES = {}
+
+# Trading signal as sent by the sidecar; fields the trader does not use are ignored
+if msgspec is not None:
+    class Signal(msgspec.Struct):
+        symbol: str
+        action: str
+        lots: float
+        stop_loss: float
+        take_profit_1: float
+        confidence: float
+        q_star: float = 0.0
+        alpha_id: str = ""
+        regime: str = ""
+    
+    class SignalsPayload(msgspec.Struct):
+        signals: list[Signal] = []
+    
+    _payload_decoder = msgspec.json.Decoder(SignalsPayload)
+    
+    def decode_signals(body):
+        """Signals from a /api/signals body or stream frame, decoded straight into structs"""
+        return _payload_decoder.decode(body).signals
+else:
+    @dataclass(slots=True)
+    class Signal:
+        symbol: str
+        action: str
+        lots: float
+        stop_loss: float
+        take_profit_1: float
+        confidence: float
+        q_star: float = 0.0
+        alpha_id: str = ""
+        regime: str = ""
+    
+    _SIGNAL_FIELDS = tuple(f.name for f in fields(Signal))
+    
+    def decode_signals(body):
+        """
+        Signals from a /api/signals body or stream frame
+        
+        Raises ValueError on a malformed payload, like the msgspec decoder.
+        """
+        try:
+            return [
+                Signal(**{name: raw[name] for name in _SIGNAL_FIELDS if name in raw})
+                for raw in _loads(body).get('signals', [])
+            ]
+        except (TypeError, AttributeError) as e:  # missing field, or not a JSON object
+            raise ValueError(f"Invalid signals payload: {e}") from e
 
 # Colors for console output
 class Colors:
@@ -24,13 +102,21 @@ class Colors:
     BLUE = '\033[94m'
     END = '\033[0m'
 
+def _format_log(timestamp, message, color=None):
+    if color:
+        return f"{color}[{timestamp}] {message}{Colors.END}"
+    return f"[{timestamp}] {message}"
+
 def log(message, color=None):
     """Print colored log message"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    if color:
-        print(f"{color}[{timestamp}] {message}{Colors.END}")
-    else:
-        print(f"[{timestamp}] {message}")
+    print(_format_log(timestamp, message, color))
+
+def log_lines(entries):
+    """Log several (message, color) entries with one write and one flush"""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    sys.stdout.write("\n".join(_format_log(timestamp, message, color) for message, color in entries) + "\n")
+    sys.stdout.flush()
 
 def initialize_mt5():
     """Initialize MT5 connection"""
@@ -54,27 +140,91 @@ def initialize_mt5():
     
     return True
 
-def get_signals():
-    """Fetch signals from sidecar"""
+def signal_params(equity, exclude=()):
+    """Query params asking the sidecar to drop signals we would reject anyway"""
+    return {
+        "equity": equity,
+        "min_confidence": MIN_CONFIDENCE,
+        "exclude": ",".join(sorted(exclude)),
+    }
+
+def get_signals(equity=None, exclude=()):
+    """
+    Fetch signals from sidecar (equity defaults to the live MT5 account)
+    
+    Signals below MIN_CONFIDENCE or on symbols in `exclude` are filtered out
+    by the sidecar before they are sent.
+    """
     try:
-        equity = mt5.account_info().equity
-        response = requests.get(
+        if equity is None:
+            equity = mt5.account_info().equity
+        response = SESSION.get(
             f"{SIDECAR_URL}/api/signals",
-            params={"equity": equity},
+            params=signal_params(equity, exclude),
             timeout=5
         )
         
         if response.status_code == 200:
-            data = response.json()
-            return data.get('signals', [])
+            return decode_signals(response.content)
         else:
             log(f"Failed to get signals: HTTP {response.status_code}", Colors.RED)
             return []
             
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         log(f"Error fetching signals: {e}", Colors.RED)
         return []
 
+def signal_batches(get_equity=None, get_exclude=None):
+    """
+    Yield signal lists as they arrive from the sidecar
+    
+    Reads the sidecar's server-sent event stream, which pushes signals as soon
+    as they are generated and yields an empty list on each keep-alive. Falls
+    back to polling get_signals() every POLL_INTERVAL when the sidecar has no
+    stream endpoint (HTTP 404). get_equity supplies the account equity sent
+    with each request; by default it is read from MT5. get_exclude supplies
+    the symbols already held, which the sidecar leaves out of its signals.
+    
+    Any error on the stream is logged and followed by a reconnect; None is
+    yielded first so the consumer drops signals it has not acted on yet.
+    """
+    if get_equity is None:
+        get_equity = lambda: mt5.account_info().equity
+    if get_exclude is None:
+        get_exclude = lambda: ()
+    
+    while True:
+        try:
+            params = signal_params(get_equity(), get_exclude())
+            params["interval"] = POLL_INTERVAL
+            with SESSION.get(
+                f"{SIDECAR_URL}/api/signals/stream",
+                params=params,
+                stream=True,
+                timeout=(5, STREAM_READ_TIMEOUT)
+            ) as response:
+                if response.status_code == 404:
+                    log("Sidecar has no signal stream - falling back to polling", Colors.YELLOW)
+                    break
+                response.raise_for_status()
+                
+                for line in response.iter_lines(decode_unicode=True):
+                    if line.startswith("data:"):
+                        yield decode_signals(line[5:])
+                    elif line.startswith(":"):
+                        yield []  # keep-alive, no new signals
+            # Server ended the stream; reconnect with current equity and holdings
+        except Exception as e:
+            # Never let the stream thread die silently: a malformed frame or a
+            # bug here must not leave the trader acting on old signals
+            log(f"Signal stream error: {type(e).__name__}: {e}. Reconnecting...", Colors.RED)
+            yield None
+            time.sleep(POLL_INTERVAL)
+    
+    while True:
+        yield get_signals(get_equity(), get_exclude())
+        time.sleep(POLL_INTERVAL)
+
 def get_open_positions():
     """Get currently open positions"""
     positions = mt5.positions_get()
@@ -82,29 +232,60 @@ def get_open_positions():
         return []
     return [p for p in positions if p.magic == MAGIC_NUMBER]
 
-def symbol_has_position(symbol):
-    """Check if we already have a position for this symbol"""
-    positions = get_open_positions()
-    return any(p.symbol == symbol for p in positions)
-
-def execute_trade(signal):
-    """Execute a trade based on signal"""
-    symbol = signal['symbol']
-    action = signal['action']
-    lots = signal['lots']
-    sl = signal['stop_loss']
-    tp = signal['take_profit_1']
-    confidence = signal['confidence']
+def get_symbol_info(symbol):
+    """
+    Symbol info, cached per symbol for SYMBOL_INFO_TTL
+    
+    Only a miss pays the symbol_select/symbol_info round-trips to the
+    terminal; execute_trade drops the entry when the market is closed.
+    """
+    cached = SYMBOL_INFO_CACHE.get(symbol)
+    if cached is not None and time.monotonic() - cached[1] < SYMBOL_INFO_TTL:
+        return cached[0]
     
     # Check if symbol exists
     if not mt5.symbol_select(symbol, True):
         log(f"Symbol {symbol} not available", Colors.RED)
-        return False
+        return None
     
-    # Get symbol info
     symbol_info = mt5.symbol_info(symbol)
     if symbol_info is None:
         log(f"Failed to get {symbol} info", Colors.RED)
+        return None
+    
+    SYMBOL_INFO_CACHE[symbol] = (symbol_info, time.monotonic())
+    return symbol_info
+
+def trade_request(symbol, order_type, **fields):
+    """Order request from the cached per-(symbol, order type) template plus the per-order fields"""
+    key = (symbol, order_type)
+    template = TRADE_TEMPLATES.get(key)
+    if template is None:
+        template = TRADE_TEMPLATES[key] = {
+            "action": mt5.TRADE_ACTION_DEAL,
+            "symbol": symbol,
+            "type": order_type,
+            "deviation": 20,
+            "magic": MAGIC_NUMBER,
+            "type_time": mt5.ORDER_TIME_GTC,
+            "type_filling": mt5.ORDER_FILLING_IOC,
+        }
+    request = template.copy()
+    request.update(fields)
+    return request
+
+def execute_trade(signal):
+    """Execute a trade based on signal"""
+    symbol = signal.symbol
+    action = signal.action
+    lots = signal.lots
+    sl = signal.stop_loss
+    tp = signal.take_profit_1
+    confidence = signal.confidence
+    
+    # Get symbol info (cached; only the tick below is fetched fresh)
+    symbol_info = get_symbol_info(symbol)
+    if symbol_info is None:
         return False
     
     # Check if trading is allowed
@@ -114,22 +295,17 @@ def execute_trade(signal):
     
     # Prepare request
     order_type = mt5.ORDER_TYPE_BUY if action == "BUY" else mt5.ORDER_TYPE_SELL
-    price = mt5.symbol_info_tick(symbol).ask if action == "BUY" else mt5.symbol_info_tick(symbol).bid
-    
-    request = {
-        "action": mt5.TRADE_ACTION_DEAL,
-        "symbol": symbol,
-        "volume": lots,
-        "type": order_type,
-        "price": price,
-        "sl": sl,
-        "tp": tp,
-        "deviation": 20,
-        "magic": MAGIC_NUMBER,
-        "comment": f"VPropTrader Q*={signal.get('q_star', 0):.1f}",
-        "type_time": mt5.ORDER_TIME_GTC,
-        "type_filling": mt5.ORDER_FILLING_IOC,
-    }
+    tick = mt5.symbol_info_tick(symbol)
+    price = tick.ask if action == "BUY" else tick.bid
+    
+    request = trade_request(
+        symbol, order_type,
+        volume=lots,
+        price=price,
+        sl=sl,
+        tp=tp,
+        comment=f"VPropTrader Q*={signal.q_star:.1f}"
+    )
     
     # Send order
     log(f"Opening {action} position: {symbol} {lots} lots (Confidence: {confidence:.2f})", Colors.BLUE)
@@ -142,6 +318,8 @@ def execute_trade(signal):
         return False
     
     if result.retcode != mt5.TRADE_RETCODE_DONE:
+        if result.retcode == mt5.TRADE_RETCODE_MARKET_CLOSED:
+            SYMBOL_INFO_CACHE.pop(symbol, None)  # re-check trade mode next time
         log(f"Order failed: {result.comment} (code: {result.retcode})", Colors.RED)
         return False
     
@@ -160,15 +338,21 @@ def monitor_positions():
     
     total_profit = sum(p.profit for p in positions)
     
-    log(f"Open Positions: {len(positions)} | Total P&L: ${total_profit:.2f}", 
-        Colors.GREEN if total_profit >= 0 else Colors.RED)
+    entries = [(f"Open Positions: {len(positions)} | Total P&L: ${total_profit:.2f}",
+                Colors.GREEN if total_profit >= 0 else Colors.RED)]
     
-    for pos in positions:
-        pnl_color = Colors.GREEN if pos.profit >= 0 else Colors.RED
-        log(f"  {pos.symbol} {pos.type_str} {pos.volume} lots | "
-            f"P&L: ${pos.profit:.2f} | Ticket: {pos.ticket}", pnl_color)
+    if VERBOSE:
+        entries.extend(
+            (f"  {pos.symbol} {pos.type_str} {pos.volume} lots | "
+             f"P&L: ${pos.profit:.2f} | Ticket: {pos.ticket}",
+             Colors.GREEN if pos.profit >= 0 else Colors.RED)
+            for pos in positions
+        )
+    
+    # One write for the whole summary instead of a print per position
+    log_lines(entries)
 
-def main():
+async def main():
     """Main trading loop"""
     log("=" * 60, Colors.BLUE)
     log("VPropTrader - Windows MT5 Auto Trader", Colors.BLUE)
@@ -187,68 +371,126 @@ def main():
     log("Auto-trading started. Press Ctrl+C to stop.", Colors.GREEN)
     log("=" * 60, Colors.BLUE)
     
+    # The loop sleeps on `wakeup` and runs as soon as a new signal batch
+    # arrives or the position count changes, or after POLL_INTERVAL at most
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+    inbox = []  # signal batches delivered by the stream thread
+    account = {"equity": mt5.account_info().equity, "occupied": frozenset()}
+    
+    def deliver(signals):
+        inbox.append(signals)
+        wakeup.set()
+    
+    def consume_signals():
+        # Blocking stream reads stay off the event loop. MT5 is only called
+        # from the loop thread, so equity and holdings come from its snapshots.
+        batches = signal_batches(lambda: account["equity"], lambda: account["occupied"])
+        for signals in batches:
+            if signals is None:
+                # Stream broke: whatever is still queued may be stale
+                loop.call_soon_threadsafe(inbox.clear)
+            elif signals:
+                loop.call_soon_threadsafe(deliver, signals)
+    
+    async def watch_account():
+        # MT5 has no change callbacks; poll it and wake the loop on a change
+        last_count = None
+        while True:
+            info = mt5.account_info()
+            if info is not None:
+                account["equity"] = info.equity
+            count = mt5.positions_total()
+            if count != last_count:
+                # Keep the sidecar's exclude list current even while no
+                # signals arrive to make the main loop fetch positions
+                account["occupied"] = frozenset(p.symbol for p in get_open_positions())
+                if last_count is not None:
+                    wakeup.set()
+            last_count = count
+            await asyncio.sleep(POLL_INTERVAL)
+    
+    threading.Thread(target=consume_signals, name="signal-stream", daemon=True).start()
+    watcher = asyncio.create_task(watch_account())
+    
     iteration = 0
     
     try:
         while True:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            
+            # Each pushed batch is the sidecar's full current set; keep the newest
+            signals = inbox[-1] if inbox else []
+            inbox.clear()
             iteration += 1
             
             # Monitor existing positions
-            if iteration % 10 == 0:  # Every 20 seconds
+            if iteration % 10 == 0:  # Every 20 seconds when idle
                 monitor_positions()
             
-            # Check if we can take more positions
-            open_positions = get_open_positions()
-            if len(open_positions) >= MAX_CONCURRENT_TRADES:
-                log(f"Max concurrent trades reached ({MAX_CONCURRENT_TRADES}). Waiting...", Colors.YELLOW)
-                time.sleep(POLL_INTERVAL)
+            # Most iterations have nothing actionable; don't touch MT5 for those
+            hot = [s for s in signals if s.confidence >= MIN_CONFIDENCE]
+            if not hot:
+                if iteration % 30 == 0:  # Log every minute
+                    log("No signals available. Waiting...", Colors.YELLOW)
                 continue
             
-            # Get signals from sidecar
-            signals = get_signals()
+            # One positions_get round-trip per iteration, reused by the checks below
+            open_positions = get_open_positions()
+            occupied_symbols = {p.symbol for p in open_positions}
+            n_open = len(open_positions)
+            account["occupied"] = frozenset(occupied_symbols)
             
-            if not signals:
-                if iteration % 30 == 0:  # Log every minute
-                    log("No signals available. Waiting...", Colors.YELLOW)
-                time.sleep(POLL_INTERVAL)
+            # Check if we can take more positions
+            if n_open >= MAX_CONCURRENT_TRADES:
+                log(f"Max concurrent trades reached ({MAX_CONCURRENT_TRADES}). Waiting...", Colors.YELLOW)
                 continue
             
             # Process signals
             log(f"Received {len(signals)} signal(s) from sidecar", Colors.BLUE)
             
             for signal in signals:
-                # Check confidence
-                if signal['confidence'] < MIN_CONFIDENCE:
-                    log(f"Skipping {signal['symbol']} - Low confidence: {signal['confidence']:.2f}", Colors.YELLOW)
+                # The sidecar already applies both filters; these checks guard
+                # against an older sidecar or holdings that changed mid-batch
+                if signal.confidence < MIN_CONFIDENCE:
+                    log(f"Skipping {signal.symbol} - Low confidence: {signal.confidence:.2f}", Colors.YELLOW)
                     continue
                 
                 # Check if we already have a position for this symbol
-                if symbol_has_position(signal['symbol']):
-                    log(f"Skipping {signal['symbol']} - Already have position", Colors.YELLOW)
+                if signal.symbol in occupied_symbols:
+                    log(f"Skipping {signal.symbol} - Already have position", Colors.YELLOW)
                     continue
                 
                 # Check if we can take more positions
-                if len(get_open_positions()) >= MAX_CONCURRENT_TRADES:
+                if n_open >= MAX_CONCURRENT_TRADES:
                     log("Max concurrent trades reached. Skipping remaining signals.", Colors.YELLOW)
                     break
                 
-                # Execute trade
-                execute_trade(signal)
+                # Execute trade; count it locally instead of re-fetching positions
+                if execute_trade(signal):
+                    occupied_symbols.add(signal.symbol)
+                    n_open += 1
+                    account["occupied"] = frozenset(occupied_symbols)
                 
                 # Small delay between trades
-                time.sleep(1)
-            
-            # Wait before next poll
-            time.sleep(POLL_INTERVAL)
-            
-    except KeyboardInterrupt:
+                await asyncio.sleep(1)
+    
+    except (KeyboardInterrupt, asyncio.CancelledError):
         log("\nShutting down auto-trader...", Colors.YELLOW)
         monitor_positions()
         log("Auto-trader stopped.", Colors.BLUE)
     
     finally:
+        watcher.cancel()
         mt5.shutdown()
         log("MT5 connection closed.", Colors.BLUE)
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass